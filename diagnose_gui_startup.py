@@ -78,20 +78,15 @@ except Exception as e:
     traceback.print_exc()
 
 # Step 5: PyQtGraph OpenGL
+# Only locate the module here: importing it initialises PyOpenGL's driver
+# bindings, which happens once in the 3D view test below
 print("[5/6] Testing PyQtGraph OpenGL integration...")
-try:
-    import pyqtgraph.opengl as gl
-    print(f"  ✓ PyQtGraph OpenGL - OK")
-except Exception as e:
-    print(f"  ✗ PyQtGraph OpenGL error: {e}")
-    import traceback
-    traceback.print_exc()
-    print("\n  This might indicate an OpenGL driver issue.")
-    if sys.platform == 'win32':
-        print("  Try updating your graphics drivers.")
-    elif sys.platform.startswith('linux'):
-        print("  Make sure OpenGL libraries are installed:")
-        print("    sudo apt-get install libgl1-mesa-dev libglu1-mesa-dev")
+import importlib.util
+if importlib.util.find_spec('pyqtgraph.opengl') is not None:
+    print(f"  ✓ PyQtGraph OpenGL - found")
+else:
+    print(f"  ✗ PyQtGraph OpenGL module not found")
+    print("\n  Reinstall with: pip install --force-reinstall pyqtgraph")
 
 # Step 6: SciPy
 print("[6/6] Testing SciPy...")
@@ -179,6 +174,11 @@ except Exception as e:
     traceback.print_exc()
     print("\n  This indicates an OpenGL issue.")
     print("  The GUI may not work properly without OpenGL support.")
+    if sys.platform == 'win32':
+        print("  Try updating your graphics drivers.")
+    elif sys.platform.startswith('linux'):
+        print("  Make sure OpenGL libraries are installed:")
+        print("    sudo apt-get install libgl1-mesa-dev libglu1-mesa-dev")
 
 print()
 print("="*60)
@@ -27,7 +27,7 @@ from typing import Dict, Tuple, List
 from tqdm import tqdm
 
 from src.model import create_model, TrajectoryLoss, compute_kl_divergence, compute_smoothness_loss, compute_boundary_loss
-from src.train import TrajectoryDataset
+from src.train import TrajectoryDataset, collate_batch
 from src.inference import TrajectoryPredictor, evaluate_trajectory_quality
 
 
@@ -85,9 +85,9 @@ class ModelPipelineDemo:
         # Show sample data structure
         sample = dataset[0]
         print(f"\nSample data structure:")
-        print(f"  Trajectory shape: {sample['trajectory'].shape}  # [seq_len, 3]")
-        print(f"  Start point: {sample['start'].numpy()}")
-        print(f"  End point: {sample['end'].numpy()}")
+        print(f"  Trajectory shape: {sample.trajectory.shape}  # [seq_len, 3]")
+        print(f"  Start point: {sample.start.numpy()}")
+        print(f"  End point: {sample.end.numpy()}")
         
         return dataset, train_dataset, val_dataset, test_dataset
     
@@ -231,7 +231,7 @@ class ModelPipelineDemo:
         print("-" * 80)
         
         # Create small dataloader
-        dataloader = DataLoader(dataset, batch_size=4, shuffle=True)
+        dataloader = DataLoader(dataset, batch_size=4, shuffle=True, collate_fn=collate_batch)
         
         # Setup optimizer
         optimizer = optim.Adam(model.parameters(), lr=0.001)
@@ -243,9 +243,9 @@ class ModelPipelineDemo:
         
         # Get one batch
         batch = next(iter(dataloader))
-        trajectory = batch['trajectory'].to(self.device)
-        start = batch['start'].to(self.device)
-        end = batch['end'].to(self.device)
+        trajectory = batch.trajectory.to(self.device)
+        start = batch.start.to(self.device)
+        end = batch.end.to(self.device)
         
         print(f"  Batch size: {trajectory.shape[0]}")
         
@@ -288,7 +288,7 @@ class ModelPipelineDemo:
         
         model.eval()
         
-        val_loader = DataLoader(val_dataset, batch_size=8, shuffle=False)
+        val_loader = DataLoader(val_dataset, batch_size=8, shuffle=False, collate_fn=collate_batch)
         criterion = TrajectoryLoss(beta=0.001, lambda_smooth=0.1, lambda_boundary=1.0)
         
         total_loss = 0.0
@@ -298,9 +298,9 @@ class ModelPipelineDemo:
         
         with torch.no_grad():
             for batch in val_loader:
-                trajectory = batch['trajectory'].to(self.device)
-                start = batch['start'].to(self.device)
-                end = batch['end'].to(self.device)
+                trajectory = batch.trajectory.to(self.device)
+                start = batch.start.to(self.device)
+                end = batch.end.to(self.device)
                 
                 # Forward pass (no teacher forcing)
                 reconstructed, mu, logvar = model(trajectory, start, end, teacher_forcing_ratio=0.0)
@@ -335,8 +335,8 @@ class ModelPipelineDemo:
         
         # Get sample start/end
         sample = dataset[0]
-        start = sample['start'].to(self.device).unsqueeze(0)
-        end = sample['end'].to(self.device).unsqueeze(0)
+        start = sample.start.to(self.device).unsqueeze(0)
+        end = sample.end.to(self.device).unsqueeze(0)
         
         print("Generating trajectories:")
         print(f"  Start: {start.cpu().numpy()[0]}")
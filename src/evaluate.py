@@ -64,9 +64,9 @@ class ModelEvaluator:
         for idx in tqdm(indices):
             sample = self.dataset[idx]
             
-            gt_trajectory = sample['trajectory'].numpy()
-            start = sample['start'].numpy()
-            end = sample['end'].numpy()
+            gt_trajectory = sample.trajectory.numpy()
+            start = sample.start.numpy()
+            end = sample.end.numpy()
             
             # Generate trajectory
             pred_trajectory = self.predictor.predict_single(start, end, n_samples=1, seq_len=len(gt_trajectory))
@@ -121,8 +121,8 @@ class ModelEvaluator:
         for idx in tqdm(indices):
             sample = self.dataset[idx]
             
-            start = sample['start'].numpy()
-            end = sample['end'].numpy()
+            start = sample.start.numpy()
+            end = sample.end.numpy()
             
             # Generate multiple trajectories
             trajectories = self.predictor.predict_single(start, end, n_samples=n_samples)
@@ -166,8 +166,8 @@ class ModelEvaluator:
         for idx in tqdm(indices):
             sample = self.dataset[idx]
             
-            start = sample['start'].numpy()
-            end = sample['end'].numpy()
+            start = sample.start.numpy()
+            end = sample.end.numpy()
             
             # Generate trajectory
             trajectory = self.predictor.predict_single(start, end, n_samples=1)[0]
@@ -209,9 +209,9 @@ class ModelEvaluator:
         for plot_idx, idx in enumerate(indices):
             sample = self.dataset[idx]
             
-            gt_trajectory = sample['trajectory'].numpy()
-            start = sample['start'].numpy()
-            end = sample['end'].numpy()
+            gt_trajectory = sample.trajectory.numpy()
+            start = sample.start.numpy()
+            end = sample.end.numpy()
             
             # Generate predictions (3 diverse trajectories)
             pred_trajectories = self.predictor.predict_single(start, end, n_samples=3)
@@ -263,8 +263,8 @@ class ModelEvaluator:
         idx = np.random.randint(len(self.dataset))
         sample = self.dataset[idx]
         
-        start = sample['start'].numpy()
-        end = sample['end'].numpy()
+        start = sample.start.numpy()
+        end = sample.end.numpy()
         
         # Generate multiple trajectories
         trajectories = self.predictor.predict_single(start, end, n_samples=n_trajectories)
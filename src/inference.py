@@ -21,15 +21,19 @@ from .model import create_model
 class TrajectoryPredictor:
     """Wrapper for easy inference"""
     
-    def __init__(self, checkpoint_path: str, device: str = 'cpu'):
+    def __init__(self, checkpoint_path: str, device: str = 'cpu', amp: Optional[bool] = None):
         """
         Initialize predictor
         
         Args:
             checkpoint_path: Path to trained model checkpoint
             device: Device to run on ('cpu' or 'cuda')
+            amp: Run the decoder under autocast (bfloat16 on CPU, float16 on CUDA);
+                defaults to CUDA only, so CPU inference keeps float32 numerics
         """
         self.device = torch.device(device)
+        self.amp = self.device.type == 'cuda' if amp is None else amp
+        self.amp_dtype = torch.float16 if self.device.type == 'cuda' else torch.bfloat16
         
         # Load checkpoint
         print(f"Loading model from {checkpoint_path}...")
@@ -68,6 +72,11 @@ class TrajectoryPredictor:
         """Denormalize output data"""
         return data * self.std + self.mean
     
+    def _autocast(self):
+        """Mixed-precision context for the decoder forward pass"""
+        return torch.autocast(device_type=self.device.type, dtype=self.amp_dtype,
+                              enabled=self.amp)
+    
     def predict_single(self, start: np.ndarray, end: np.ndarray,
                       n_samples: int = 1, seq_len: int = 50) -> np.ndarray:
         """
@@ -91,11 +100,12 @@ class TrajectoryPredictor:
         end_norm = self.normalize(end_tensor)
         
         # Generate
-        with torch.no_grad():
-            trajectories_norm = self.model.generate(start_norm, end_norm, n_samples, seq_len)
+        with torch.inference_mode():
+            with self._autocast():
+                trajectories_norm = self.model.generate(start_norm, end_norm, n_samples, seq_len)
             
-            # Denormalize
-            trajectories = self.denormalize(trajectories_norm)
+            # Denormalize in float32
+            trajectories = self.denormalize(trajectories_norm.float())
         
         return trajectories.cpu().numpy()
     
@@ -122,11 +132,12 @@ class TrajectoryPredictor:
         ends_norm = self.normalize(ends_tensor)
         
         # Generate
-        with torch.no_grad():
-            trajectories_norm = self.model.generate(starts_norm, ends_norm, n_samples, seq_len)
+        with torch.inference_mode():
+            with self._autocast():
+                trajectories_norm = self.model.generate(starts_norm, ends_norm, n_samples, seq_len)
             
-            # Denormalize
-            trajectories = self.denormalize(trajectories_norm)
+            # Denormalize in float32
+            trajectories = self.denormalize(trajectories_norm.float())
         
         return trajectories.cpu().numpy()
     
@@ -150,10 +161,14 @@ class TrajectoryPredictor:
         # Generate candidates
         trajectories = self.predict_single(start, end, n_candidates, seq_len)
         
+        # Extract obstacle arrays once instead of per trajectory point
+        centers = np.asarray([obs['center'] for obs in obstacles], dtype=np.float32).reshape(-1, 3)
+        radii = np.asarray([obs['radius'] for obs in obstacles], dtype=np.float32)
+        
         # Compute safety scores
         scores = []
         for traj in trajectories:
-            score = self._compute_safety_score(traj, obstacles)
+            score = self._compute_safety_score(traj, centers, radii)
             scores.append(score)
         
         scores = np.array(scores)
@@ -166,33 +181,26 @@ class TrajectoryPredictor:
         return trajectories, scores
     
     def _compute_safety_score(self, trajectory: np.ndarray, 
-                             obstacles: List[Dict]) -> float:
+                             centers: np.ndarray, radii: np.ndarray) -> float:
         """
         Compute safety score for trajectory
         
         Args:
             trajectory: Trajectory waypoints [seq_len, 3]
-            obstacles: List of obstacles
+            centers: Obstacle centers [n_obstacles, 3]
+            radii: Obstacle radii [n_obstacles]
             
         Returns:
             score: Safety score (higher is better)
         """
-        if len(obstacles) == 0:
+        if len(radii) == 0:
             return 1.0
         
-        min_distance = float('inf')
-        collision_penalty = 0.0
+        # Clearance of every point to every obstacle surface [seq_len, n_obstacles]
+        dists = np.linalg.norm(trajectory[:, None, :] - centers[None, :, :], axis=2) - radii
         
-        for point in trajectory:
-            for obs in obstacles:
-                center = np.array(obs['center'])
-                radius = obs['radius']
-                
-                dist = np.linalg.norm(point - center) - radius
-                min_distance = min(min_distance, dist)
-                
-                if dist < 0:
-                    collision_penalty += abs(dist)
+        min_distance = float(dists.min())
+        collision_penalty = float(-dists[dists < 0].sum())
         
         # Safety score based on minimum clearance and collisions
         if collision_penalty > 0:
@@ -330,11 +338,13 @@ def main():
                        choices=['cpu', 'cuda'], help='Device to run on')
     parser.add_argument('--n_samples', type=int, default=5,
                        help='Number of trajectories to generate')
+    parser.add_argument('--no_amp', action='store_true',
+                       help='Disable float16 autocast during CUDA generation')
     
     args = parser.parse_args()
     
     # Create predictor
-    predictor = TrajectoryPredictor(args.checkpoint, device=args.device)
+    predictor = TrajectoryPredictor(args.checkpoint, device=args.device, amp=False if args.no_amp else None)
     
     # Example: Generate trajectories
     print("\n" + "="*60)
@@ -14,7 +14,7 @@ warnings.filterwarnings('ignore', message='.*invalid value encountered.*')
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Union
 
 
 class TrajectoryEncoder(nn.Module):
@@ -39,9 +39,19 @@ class TrajectoryEncoder(nn.Module):
             bidirectional=True
         )
         
-        # Project to latent distribution parameters
-        self.fc_mu = nn.Linear(hidden_dim * 2, latent_dim)
-        self.fc_logvar = nn.Linear(hidden_dim * 2, latent_dim)
+        # Project to latent distribution parameters (mu and logvar fused into one GEMM)
+        self.fc_mulogvar = nn.Linear(hidden_dim * 2, latent_dim * 2)
+        
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        # Remap checkpoints saved with separate fc_mu / fc_logvar layers
+        for param in ('weight', 'bias'):
+            mu_key = f'{prefix}fc_mu.{param}'
+            logvar_key = f'{prefix}fc_logvar.{param}'
+            if mu_key in state_dict and logvar_key in state_dict:
+                state_dict[f'{prefix}fc_mulogvar.{param}'] = torch.cat(
+                    [state_dict.pop(mu_key), state_dict.pop(logvar_key)], dim=0
+                )
+        super()._load_from_state_dict(state_dict, prefix, *args, **kwargs)
         
     def forward(self, x: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
         """
@@ -55,15 +65,13 @@ class TrajectoryEncoder(nn.Module):
         # LSTM encoding
         lstm_out, (hidden, cell) = self.lstm(x)
         
-        # Use final hidden state (concatenate forward and backward)
+        # Use final hidden state (forward and backward of the top layer)
         # hidden shape: [num_layers * 2, batch_size, hidden_dim]
-        hidden_forward = hidden[-2, :, :]
-        hidden_backward = hidden[-1, :, :]
-        hidden_concat = torch.cat([hidden_forward, hidden_backward], dim=1)
+        batch_size = x.size(0)
+        hidden_concat = hidden[-2:].transpose(0, 1).reshape(batch_size, -1)
         
         # Compute latent distribution parameters
-        mu = self.fc_mu(hidden_concat)
-        logvar = self.fc_logvar(hidden_concat)
+        mu, logvar = self.fc_mulogvar(hidden_concat).chunk(2, dim=-1)
         
         return mu, logvar
 
@@ -107,14 +115,14 @@ class TrajectoryDecoder(nn.Module):
         
     def forward(self, z: torch.Tensor, conditions: torch.Tensor,
                 seq_len: int, teacher_forcing_trajectory: Optional[torch.Tensor] = None,
-                teacher_forcing_ratio: float = 0.5) -> torch.Tensor:
+                teacher_forcing_ratio: Union[float, torch.Tensor] = 0.5) -> torch.Tensor:
         """
         Args:
             z: Latent vector [batch_size, latent_dim]
             conditions: Start and end waypoints [batch_size, 6] (start_xyz + end_xyz)
             seq_len: Length of trajectory to generate
             teacher_forcing_trajectory: Ground truth for teacher forcing [batch_size, seq_len, 3]
-            teacher_forcing_ratio: Probability of using teacher forcing
+            teacher_forcing_ratio: Probability of using teacher forcing (float or 0-d tensor)
             
         Returns:
             trajectory: Generated trajectory [batch_size, seq_len, 3]
@@ -138,6 +146,11 @@ class TrajectoryDecoder(nn.Module):
         z_expanded = z.unsqueeze(1)  # [batch_size, 1, latent_dim]
         conditions_expanded = conditions.unsqueeze(1)  # [batch_size, 1, 6]
         
+        # Teacher forcing coin flips for every step, drawn on-device in one call
+        # (no per-step .item() host sync / torch.compile graph break)
+        if teacher_forcing_trajectory is not None:
+            use_teacher_forcing = torch.rand(seq_len, device=z.device) < teacher_forcing_ratio
+        
         for t in range(seq_len):
             # Concatenate current input with latent and conditions
             lstm_input = torch.cat([current_input, z_expanded, conditions_expanded], dim=2)
@@ -150,11 +163,9 @@ class TrajectoryDecoder(nn.Module):
             outputs.append(output)
             
             # Teacher forcing
-            use_teacher_forcing = (teacher_forcing_trajectory is not None and 
-                                  torch.rand(1).item() < teacher_forcing_ratio)
-            
-            if use_teacher_forcing and t < seq_len - 1:
-                current_input = teacher_forcing_trajectory[:, t:t+1, :]
+            if teacher_forcing_trajectory is not None and t < seq_len - 1:
+                current_input = torch.where(use_teacher_forcing[t],
+                                            teacher_forcing_trajectory[:, t:t+1, :], output)
             else:
                 current_input = output
         
@@ -205,7 +216,7 @@ class CVAE_TrajectoryGenerator(nn.Module):
         return z
     
     def forward(self, trajectory: torch.Tensor, start: torch.Tensor, 
-                end: torch.Tensor, teacher_forcing_ratio: float = 0.5) -> Tuple:
+                end: torch.Tensor, teacher_forcing_ratio: Union[float, torch.Tensor] = 0.5) -> Tuple:
         """
         Forward pass during training
         
@@ -258,15 +269,13 @@ class CVAE_TrajectoryGenerator(nn.Module):
             batch_size = start.size(0)
             seq_len = seq_len or self.max_seq_len
             
-            # Repeat start and end for n_samples
-            start_repeated = start.repeat_interleave(n_samples, dim=0)
-            end_repeated = end.repeat_interleave(n_samples, dim=0)
+            # Build conditions once, then repeat for n_samples
+            conditions = torch.cat([start, end], dim=1).repeat_interleave(n_samples, dim=0)
             
             # Sample from prior
             z = torch.randn(batch_size * n_samples, self.latent_dim, device=start.device)
             
             # Decode
-            conditions = torch.cat([start_repeated, end_repeated], dim=1)
             trajectories = self.decoder(z, conditions, seq_len)
             
         return trajectories
@@ -365,7 +374,8 @@ class TrajectoryLoss(nn.Module):
             
         Returns:
             total_loss: Combined loss
-            loss_dict: Dictionary of individual losses
+            loss_dict: Dictionary of individual losses as detached scalar tensors
+                (call .item() only when logging to avoid a device sync per step)
         """
         # Reconstruction loss
         recon_loss = F.mse_loss(reconstructed, target)
@@ -386,11 +396,11 @@ class TrajectoryLoss(nn.Module):
                      self.lambda_boundary * boundary_loss)
         
         loss_dict = {
-            'total': total_loss.item(),
-            'reconstruction': recon_loss.item(),
-            'kl': kl_loss.item(),
-            'smoothness': smooth_loss.item(),
-            'boundary': boundary_loss.item()
+            'total': total_loss.detach(),
+            'reconstruction': recon_loss.detach(),
+            'kl': kl_loss.detach(),
+            'smoothness': smooth_loss.detach(),
+            'boundary': boundary_loss.detach()
         }
         
         return total_loss, loss_dict
@@ -452,7 +462,7 @@ if __name__ == '__main__':
     loss, loss_dict = criterion(reconstructed, trajectory, mu, logvar, start, end)
     print(f"\nLoss breakdown:")
     for k, v in loss_dict.items():
-        print(f"  {k}: {v:.4f}")
+        print(f"  {k}: {v.item():.4f}")
     
     # Count parameters
     n_params = sum(p.numel() for p in model.parameters() if p.requires_grad)
@@ -13,75 +13,202 @@ warnings.filterwarnings('ignore', message='.*invalid value encountered.*')
 import torch
 import torch.nn as nn
 import torch.optim as optim
-from torch.utils.data import Dataset, DataLoader, random_split
+from torch.utils.data import Dataset, DataLoader
 from torch.utils.tensorboard import SummaryWriter
 import numpy as np
 import os
 import argparse
-from tqdm import tqdm
 import json
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Optional, NamedTuple, List, Any, Union
+from concurrent.futures import ThreadPoolExecutor
 
 from .model import create_model, TrajectoryLoss
 
 
+class Batch(NamedTuple):
+    """Trajectory sample or collated batch (one tensor per field)"""
+    trajectory: torch.Tensor
+    start: torch.Tensor
+    end: torch.Tensor
+    
+    def pin_memory(self) -> 'Batch':
+        """Pin all fields together (called by DataLoader when pin_memory=True)"""
+        return Batch(self.trajectory.pin_memory(), self.start.pin_memory(), self.end.pin_memory())
+
+
+def collate_batch(samples: List[Batch]) -> Batch:
+    """Stack a list of samples into a single Batch"""
+    trajectories, starts, ends = zip(*samples)
+    return Batch(torch.stack(trajectories), torch.stack(starts), torch.stack(ends))
+
+
 class TrajectoryDataset(Dataset):
     """PyTorch Dataset for trajectory data"""
     
-    def __init__(self, data_path: str, normalize: bool = True):
+    def __init__(self, data_path: str, normalize: bool = True, pin_memory: bool = False,
+                 device: Optional[torch.device] = None, half_precision: bool = False):
         """
         Args:
             data_path: Path to .npz file
             normalize: Whether to normalize the data
+            pin_memory: Keep the dataset tensors in page-locked memory for fast H2D copies
+            device: Device to compute normalization on (default: CPU); results stay on CPU
+            half_precision: Store the (normalized) tensors as float16 to halve memory and bandwidth
         """
-        # Load data
-        data = np.load(data_path)
-        
-        self.trajectories = torch.FloatTensor(data['trajectories'])
-        self.start_points = torch.FloatTensor(data['start_points'])
-        self.end_points = torch.FloatTensor(data['end_points'])
+        # Load data (mmap_mode applies to plain .npy members; from_numpy avoids a second copy)
+        with np.load(data_path, mmap_mode='r') as data:
+            self.trajectories = torch.from_numpy(
+                np.ascontiguousarray(data['trajectories'], dtype=np.float32))
+            self.start_points = torch.from_numpy(
+                np.ascontiguousarray(data['start_points'], dtype=np.float32))
+            self.end_points = torch.from_numpy(
+                np.ascontiguousarray(data['end_points'], dtype=np.float32))
         
         self.normalize = normalize
         
         if normalize:
-            # Compute normalization statistics
-            all_points = torch.cat([
-                self.trajectories.reshape(-1, 3),
-                self.start_points,
-                self.end_points
-            ], dim=0)
+            # Normalize on the target device in one shot, then copy back for the DataLoader
+            device = device or torch.device('cpu')
+            tensors = [t.to(device, non_blocking=True)
+                       for t in (self.trajectories, self.start_points, self.end_points)]
             
-            self.mean = all_points.mean(dim=0)
-            self.std = all_points.std(dim=0)
+            # Reuse statistics cached next to the data file when it has not changed
+            stats_path = data_path + '.stats.json'
+            cached = self._load_cached_stats(stats_path, data_path)
+            if cached is not None:
+                mean = torch.tensor(cached['mean'], device=device)
+                std = torch.tensor(cached['std'], device=device)
+            else:
+                # Compute normalization statistics per tensor and pool them, instead of
+                # concatenating every point into one large temporary
+                parts = (tensors[0].reshape(-1, 3), tensors[1], tensors[2])
+                counts = [part.size(0) for part in parts]
+                var_means = [torch.var_mean(part, dim=0, correction=0) for part in parts]
+                n_points = sum(counts)
+                
+                mean = sum(n * m for n, (_, m) in zip(counts, var_means)) / n_points
+                sq_dev = sum(n * (v + (m - mean) ** 2) for n, (v, m) in zip(counts, var_means))
+                std = (sq_dev / (n_points - 1)).sqrt()
+                self._save_cached_stats(stats_path, data_path, mean, std)
             
-            # Normalize
-            self.trajectories = (self.trajectories - self.mean) / self.std
-            self.start_points = (self.start_points - self.mean) / self.std
-            self.end_points = (self.end_points - self.mean) / self.std
+            # Normalize in place
+            for t, host in zip(tensors, (self.trajectories, self.start_points, self.end_points)):
+                t.sub_(mean).div_(std)
+                if t is not host:
+                    host.copy_(t)
+            
+            self.mean = mean.cpu()
+            self.std = std.cpu()
             
             print(f"Data normalized - Mean: {self.mean}, Std: {self.std}")
         else:
             self.mean = torch.zeros(3)
             self.std = torch.ones(3)
+        
+        if half_precision:
+            self.trajectories = self.trajectories.half()
+            self.start_points = self.start_points.half()
+            self.end_points = self.end_points.half()
+        
+        if pin_memory and torch.cuda.is_available():
+            self.trajectories = self.trajectories.pin_memory()
+            self.start_points = self.start_points.pin_memory()
+            self.end_points = self.end_points.pin_memory()
+    
+    @staticmethod
+    def _load_cached_stats(stats_path: str, data_path: str) -> Optional[Dict]:
+        """Load cached mean/std if they were computed for the current data file"""
+        if not os.path.exists(stats_path):
+            return None
+        try:
+            with open(stats_path, 'r') as f:
+                stats = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if stats.get('data_mtime') != os.path.getmtime(data_path):
+            return None
+        return stats
+    
+    @staticmethod
+    def _save_cached_stats(stats_path: str, data_path: str,
+                           mean: torch.Tensor, std: torch.Tensor):
+        """Cache mean/std next to the data file (best effort)"""
+        stats = {
+            'data_mtime': os.path.getmtime(data_path),
+            'mean': mean.cpu().tolist(),
+            'std': std.cpu().tolist()
+        }
+        try:
+            with open(stats_path, 'w') as f:
+                json.dump(stats, f, indent=2)
+        except OSError:
+            pass
     
     def __len__(self):
         return len(self.trajectories)
     
-    def __getitem__(self, idx):
-        return {
-            'trajectory': self.trajectories[idx],
-            'start': self.start_points[idx],
-            'end': self.end_points[idx]
-        }
+    def __getitem__(self, idx) -> Batch:
+        return Batch(self.trajectories[idx], self.start_points[idx], self.end_points[idx])
     
     def denormalize(self, data: torch.Tensor) -> torch.Tensor:
         """Denormalize data back to original scale"""
         return data * self.std + self.mean
 
 
+class TrajectorySplit(Dataset):
+    """Contiguous copy of a subset of a TrajectoryDataset (no per-item index indirection)"""
+    
+    def __init__(self, trajectories: torch.Tensor, start_points: torch.Tensor,
+                 end_points: torch.Tensor):
+        self.trajectories = trajectories
+        self.start_points = start_points
+        self.end_points = end_points
+    
+    def __len__(self):
+        return len(self.trajectories)
+    
+    def __getitem__(self, idx) -> Batch:
+        return Batch(self.trajectories[idx], self.start_points[idx], self.end_points[idx])
+
+
+def split_dataset(dataset: TrajectoryDataset, lengths: List[int],
+                  seed: int) -> List[TrajectorySplit]:
+    """
+    Randomly split a dataset into contiguous, non-overlapping splits
+    
+    Uses the same permutation as torch.utils.data.random_split for a given seed,
+    but gathers each split once instead of indexing through a Subset every step.
+    
+    Args:
+        dataset: Dataset to split
+        lengths: Number of samples in each split
+        seed: Random seed for the permutation
+        
+    Returns:
+        splits: One TrajectorySplit per entry in lengths
+    """
+    perm = torch.randperm(sum(lengths), generator=torch.Generator().manual_seed(seed))
+    pinned = dataset.trajectories.is_pinned()
+    
+    splits = []
+    offset = 0
+    for n in lengths:
+        idx = perm[offset:offset + n]
+        offset += n
+        tensors = [t[idx] for t in (dataset.trajectories, dataset.start_points, dataset.end_points)]
+        if pinned:
+            tensors = [t.pin_memory() for t in tensors]
+        splits.append(TrajectorySplit(*tensors))
+    
+    return splits
+
+
 def train_epoch(model: nn.Module, dataloader: DataLoader, 
                 criterion: nn.Module, optimizer: optim.Optimizer,
-                device: torch.device, teacher_forcing_ratio: float = 0.5) -> Dict:
+                device: torch.device, teacher_forcing_ratio: Union[float, torch.Tensor] = 0.5,
+                scaler: Optional[torch.amp.GradScaler] = None,
+                amp_dtype: Optional[torch.dtype] = None,
+                log_interval: Optional[int] = None, accum_steps: int = 1) -> Dict:
     """
     Train for one epoch
     
@@ -91,72 +218,93 @@ def train_epoch(model: nn.Module, dataloader: DataLoader,
         criterion: Loss function
         optimizer: Optimizer
         device: Device to train on
-        teacher_forcing_ratio: Teacher forcing ratio
+        teacher_forcing_ratio: Teacher forcing ratio (float or 0-d tensor)
+        scaler: Gradient scaler for float16 mixed precision (None to disable)
+        amp_dtype: Autocast dtype (None to train in float32)
+        log_interval: Print running losses every N batches (default: ~20 times per epoch)
+        accum_steps: Number of batches to accumulate gradients over per optimizer step
         
     Returns:
         metrics: Dictionary of training metrics
     """
     model.train()
     
-    total_loss = 0.0
+    # Accumulate on-device; losses are only copied to the host at log boundaries
+    total_loss = torch.zeros((), device=device)
     loss_components = {
-        'reconstruction': 0.0,
-        'kl': 0.0,
-        'smoothness': 0.0,
-        'boundary': 0.0
+        'reconstruction': torch.zeros((), device=device),
+        'kl': torch.zeros((), device=device),
+        'smoothness': torch.zeros((), device=device),
+        'boundary': torch.zeros((), device=device)
     }
     
     n_batches = 0
+    n_steps = len(dataloader)
+    log_interval = log_interval or max(1, n_steps // 20)
     
-    progress_bar = tqdm(dataloader, desc='Training')
+    optimizer.zero_grad(set_to_none=True)
     
-    for batch in progress_bar:
-        trajectory = batch['trajectory'].to(device)
-        start = batch['start'].to(device)
-        end = batch['end'].to(device)
-        
-        # Forward pass
-        reconstructed, mu, logvar = model(trajectory, start, end, teacher_forcing_ratio)
-        
-        # Compute loss
-        loss, loss_dict = criterion(reconstructed, trajectory, mu, logvar, start, end)
+    for batch in dataloader:
+        trajectory = batch.trajectory.to(device, torch.float32, non_blocking=True)
+        start = batch.start.to(device, torch.float32, non_blocking=True)
+        end = batch.end.to(device, torch.float32, non_blocking=True)
         
-        # Backward pass
-        optimizer.zero_grad()
-        loss.backward()
-        
-        # Gradient clipping
-        torch.nn.utils.clip_grad_norm_(model.parameters(), max_norm=1.0)
+        with torch.autocast(device_type=device.type, dtype=amp_dtype,
+                            enabled=amp_dtype is not None):
+            # Forward pass
+            reconstructed, mu, logvar = model(trajectory, start, end, teacher_forcing_ratio)
+            
+            # Compute loss
+            loss, loss_dict = criterion(reconstructed, trajectory, mu, logvar, start, end)
         
-        optimizer.step()
+        # Backward pass (gradients accumulate over accum_steps batches)
+        scaled_loss = loss / accum_steps
+        if scaler is not None:
+            scaler.scale(scaled_loss).backward()
+        else:
+            scaled_loss.backward()
         
         # Accumulate metrics
-        total_loss += loss.item()
+        total_loss += loss.detach()
         for k in loss_components:
             loss_components[k] += loss_dict[k]
         n_batches += 1
         
-        # Update progress bar
-        progress_bar.set_postfix({
-            'loss': loss.item(),
-            'recon': loss_dict['reconstruction'],
-            'kl': loss_dict['kl']
-        })
+        if n_batches % accum_steps == 0 or n_batches == n_steps:
+            # Gradient clipping
+            if scaler is not None:
+                scaler.unscale_(optimizer)
+            torch.nn.utils.clip_grad_norm_(model.parameters(), max_norm=1.0)
+            
+            if scaler is not None:
+                scaler.step(optimizer)
+                scaler.update()
+            else:
+                optimizer.step()
+            optimizer.zero_grad(set_to_none=True)
+        
+        # Print running averages
+        if n_batches % log_interval == 0:
+            print(f"  Training [{n_batches}/{n_steps}] "
+                  f"loss: {total_loss.item() / n_batches:.4f} | "
+                  f"recon: {loss_components['reconstruction'].item() / n_batches:.4f} | "
+                  f"kl: {loss_components['kl'].item() / n_batches:.4f}")
     
     # Average metrics
     metrics = {
-        'loss': total_loss / n_batches,
-        'reconstruction_loss': loss_components['reconstruction'] / n_batches,
-        'kl_loss': loss_components['kl'] / n_batches,
-        'smoothness_loss': loss_components['smoothness'] / n_batches,
-        'boundary_loss': loss_components['boundary'] / n_batches
+        'loss': total_loss.item() / n_batches,
+        'reconstruction_loss': loss_components['reconstruction'].item() / n_batches,
+        'kl_loss': loss_components['kl'].item() / n_batches,
+        'smoothness_loss': loss_components['smoothness'].item() / n_batches,
+        'boundary_loss': loss_components['boundary'].item() / n_batches
     }
     
     return metrics
 
 
 def validate(model: nn.Module, dataloader: DataLoader,
-            criterion: nn.Module, device: torch.device) -> Dict:
+            criterion: nn.Module, device: torch.device,
+            amp_dtype: Optional[torch.dtype] = None) -> Dict:
     """
     Validate model
     
@@ -165,52 +313,85 @@ def validate(model: nn.Module, dataloader: DataLoader,
         dataloader: Validation data loader
         criterion: Loss function
         device: Device
+        amp_dtype: Autocast dtype (None to evaluate in float32)
         
     Returns:
         metrics: Dictionary of validation metrics
     """
     model.eval()
     
-    total_loss = 0.0
+    # Accumulate on-device; losses are only copied to the host at log boundaries
+    total_loss = torch.zeros((), device=device)
     loss_components = {
-        'reconstruction': 0.0,
-        'kl': 0.0,
-        'smoothness': 0.0,
-        'boundary': 0.0
+        'reconstruction': torch.zeros((), device=device),
+        'kl': torch.zeros((), device=device),
+        'smoothness': torch.zeros((), device=device),
+        'boundary': torch.zeros((), device=device)
     }
     
     n_batches = 0
     
-    with torch.no_grad():
-        for batch in tqdm(dataloader, desc='Validation'):
-            trajectory = batch['trajectory'].to(device)
-            start = batch['start'].to(device)
-            end = batch['end'].to(device)
+    with torch.inference_mode():
+        for batch in dataloader:
+            trajectory = batch.trajectory.to(device, torch.float32, non_blocking=True)
+            start = batch.start.to(device, torch.float32, non_blocking=True)
+            end = batch.end.to(device, torch.float32, non_blocking=True)
             
-            # Forward pass
-            reconstructed, mu, logvar = model(trajectory, start, end, teacher_forcing_ratio=0.0)
-            
-            # Compute loss
-            loss, loss_dict = criterion(reconstructed, trajectory, mu, logvar, start, end)
+            with torch.autocast(device_type=device.type, dtype=amp_dtype,
+                                enabled=amp_dtype is not None):
+                # Forward pass
+                reconstructed, mu, logvar = model(trajectory, start, end, teacher_forcing_ratio=0.0)
+                
+                # Compute loss
+                loss, loss_dict = criterion(reconstructed, trajectory, mu, logvar, start, end)
             
             # Accumulate metrics
-            total_loss += loss.item()
+            total_loss += loss.detach()
             for k in loss_components:
                 loss_components[k] += loss_dict[k]
             n_batches += 1
     
     # Average metrics
     metrics = {
-        'loss': total_loss / n_batches,
-        'reconstruction_loss': loss_components['reconstruction'] / n_batches,
-        'kl_loss': loss_components['kl'] / n_batches,
-        'smoothness_loss': loss_components['smoothness'] / n_batches,
-        'boundary_loss': loss_components['boundary'] / n_batches
+        'loss': total_loss.item() / n_batches,
+        'reconstruction_loss': loss_components['reconstruction'].item() / n_batches,
+        'kl_loss': loss_components['kl'].item() / n_batches,
+        'smoothness_loss': loss_components['smoothness'].item() / n_batches,
+        'boundary_loss': loss_components['boundary'].item() / n_batches
     }
     
     return metrics
 
 
+def snapshot_state_dict(model: nn.Module, buffer: Dict[str, torch.Tensor]) -> Dict[str, torch.Tensor]:
+    """
+    Copy model weights into a preallocated CPU buffer
+    
+    Args:
+        model: Model to snapshot
+        buffer: CPU tensors (pinned when training on CUDA) keyed like model.state_dict()
+        
+    Returns:
+        buffer: The filled buffer, safe to pass to torch.save
+    """
+    for k, v in model.state_dict().items():
+        buffer[k].copy_(v, non_blocking=True)
+    if torch.cuda.is_available():
+        torch.cuda.synchronize()
+    return buffer
+
+
+def state_to_cpu(state: Any) -> Any:
+    """Recursively copy tensors in a (nested) state dict to CPU"""
+    if isinstance(state, torch.Tensor):
+        return state.detach().to('cpu', copy=True)
+    if isinstance(state, dict):
+        return {k: state_to_cpu(v) for k, v in state.items()}
+    if isinstance(state, (list, tuple)):
+        return type(state)(state_to_cpu(v) for v in state)
+    return state
+
+
 def train_model(args):
     """
     Main training function
@@ -218,17 +399,28 @@ def train_model(args):
     Args:
         args: Command line arguments
     """
+    # Expandable allocator segments reduce fragmentation; must be set before the first CUDA allocation
+    os.environ.setdefault('PYTORCH_CUDA_ALLOC_CONF', 'expandable_segments:True')
+    
     # Set device
     device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
     print(f"Using device: {device}")
     
+    # Shapes are fixed, so let cuDNN autotune the LSTM kernels; allow TF32 on Ampere+
+    torch.backends.cudnn.benchmark = True
+    torch.backends.cuda.matmul.allow_tf32 = True
+    torch.backends.cudnn.allow_tf32 = True
+    torch.set_float32_matmul_precision('high')
+    
     # Create directories
     os.makedirs(args.save_dir, exist_ok=True)
     os.makedirs(args.log_dir, exist_ok=True)
     
     # Load dataset
     print(f"Loading dataset from {args.data_path}...")
-    full_dataset = TrajectoryDataset(args.data_path, normalize=True)
+    full_dataset = TrajectoryDataset(args.data_path, normalize=True,
+                                     pin_memory=device.type == 'cuda', device=device,
+                                     half_precision=args.input_fp16)
     
     # Split dataset
     n_total = len(full_dataset)
@@ -236,20 +428,26 @@ def train_model(args):
     n_val = int(0.1 * n_total)
     n_test = n_total - n_train - n_val
     
-    train_dataset, val_dataset, test_dataset = random_split(
-        full_dataset, [n_train, n_val, n_test],
-        generator=torch.Generator().manual_seed(args.seed)
+    train_dataset, val_dataset, test_dataset = split_dataset(
+        full_dataset, [n_train, n_val, n_test], seed=args.seed
     )
     
     print(f"Dataset split: Train={n_train}, Val={n_val}, Test={n_test}")
     
-    # Create data loaders
+    # Create data loaders (persistent workers keep prefetching pinned batches across epochs)
+    worker_kwargs = {}
+    if args.num_workers > 0:
+        worker_kwargs = {'persistent_workers': True, 'prefetch_factor': 4}
+    
     train_loader = DataLoader(
         train_dataset,
         batch_size=args.batch_size,
         shuffle=True,
+        drop_last=n_train > args.batch_size,  # keep batch shape fixed for cuDNN autotuning
         num_workers=args.num_workers,
-        pin_memory=True if device.type == 'cuda' else False
+        pin_memory=True if device.type == 'cuda' else False,
+        collate_fn=collate_batch,
+        **worker_kwargs
     )
     
     val_loader = DataLoader(
@@ -257,7 +455,9 @@ def train_model(args):
         batch_size=args.batch_size,
         shuffle=False,
         num_workers=args.num_workers,
-        pin_memory=True if device.type == 'cuda' else False
+        pin_memory=True if device.type == 'cuda' else False,
+        collate_fn=collate_batch,
+        **worker_kwargs
     )
     
     # Create model
@@ -281,15 +481,44 @@ def train_model(args):
         lambda_boundary=args.lambda_boundary
     )
     
-    optimizer = optim.Adam(model.parameters(), lr=args.lr, weight_decay=args.weight_decay)
+    # Compile model and loss for fused kernels (checkpoints still use the eager model)
+    train_net = model
+    if args.compile:
+        print(f"Compiling model with torch.compile (mode={args.compile_mode})...")
+        train_net = torch.compile(model, mode=args.compile_mode, dynamic=False)
+        criterion = torch.compile(criterion, mode=args.compile_mode, dynamic=False)
+    
+    # Single-kernel fused AdamW on CUDA, multi-tensor (foreach) implementation on CPU
+    use_fused = device.type == 'cuda'
+    optimizer = optim.AdamW(model.parameters(), lr=args.lr, weight_decay=args.weight_decay,
+                            fused=use_fused, foreach=not use_fused)
+    
+    # Mixed precision: bfloat16 needs no loss scaling, float16 does
+    amp_dtype = None
+    scaler = None
+    if args.amp:
+        amp_dtype = torch.bfloat16 if args.bf16 else torch.float16
+        if amp_dtype == torch.float16:
+            scaler = torch.amp.GradScaler(device.type)
+        print(f"Mixed precision enabled ({amp_dtype})")
     
     # Learning rate scheduler
     scheduler = optim.lr_scheduler.ReduceLROnPlateau(
         optimizer, mode='min', factor=0.5, patience=5
     )
     
-    # TensorBoard
-    writer = SummaryWriter(args.log_dir)
+    # Reusable CPU mirror of the model weights for checkpointing
+    cpu_model_buffer = {
+        k: torch.empty_like(v, device='cpu', pin_memory=device.type == 'cuda')
+        for k, v in model.state_dict().items()
+    }
+    
+    # Checkpoints are serialized on a background thread while training continues
+    ckpt_pool = ThreadPoolExecutor(max_workers=1)
+    pending_save = None
+    
+    # TensorBoard (events are queued and flushed in the background, not every epoch)
+    writer = SummaryWriter(args.log_dir, max_queue=100, flush_secs=120)
     
     # Training loop
     best_val_loss = float('inf')
@@ -298,86 +527,105 @@ def train_model(args):
     print("\nStarting training...")
     print("=" * 60)
     
-    for epoch in range(args.epochs):
-        print(f"\nEpoch {epoch + 1}/{args.epochs}")
-        
-        # Teacher forcing ratio decay
-        teacher_forcing_ratio = max(0.5 * (0.99 ** epoch), 0.1)
-        
-        # Train
-        train_metrics = train_epoch(
-            model, train_loader, criterion, optimizer, device, teacher_forcing_ratio
-        )
-        
-        # Validate
-        val_metrics = validate(model, val_loader, criterion, device)
-        
-        # Learning rate scheduling
-        scheduler.step(val_metrics['loss'])
-        
-        # Print metrics
-        print(f"Train Loss: {train_metrics['loss']:.4f} | Val Loss: {val_metrics['loss']:.4f}")
-        print(f"  Recon: {train_metrics['reconstruction_loss']:.4f} | {val_metrics['reconstruction_loss']:.4f}")
-        print(f"  KL: {train_metrics['kl_loss']:.4f} | {val_metrics['kl_loss']:.4f}")
-        print(f"  Smooth: {train_metrics['smoothness_loss']:.4f} | {val_metrics['smoothness_loss']:.4f}")
-        print(f"  Boundary: {train_metrics['boundary_loss']:.4f} | {val_metrics['boundary_loss']:.4f}")
-        
-        # TensorBoard logging
-        for k, v in train_metrics.items():
-            writer.add_scalar(f'train/{k}', v, epoch)
-        for k, v in val_metrics.items():
-            writer.add_scalar(f'val/{k}', v, epoch)
-        writer.add_scalar('learning_rate', optimizer.param_groups[0]['lr'], epoch)
-        
-        # Save best model
-        if val_metrics['loss'] < best_val_loss:
-            best_val_loss = val_metrics['loss']
-            patience_counter = 0
+    # Checkpoint writer thread is always shut down, even if an epoch raises
+    try:
+        for epoch in range(args.epochs):
+            print(f"\nEpoch {epoch + 1}/{args.epochs}")
             
-            checkpoint = {
-                'epoch': epoch,
-                'model_state_dict': model.state_dict(),
-                'optimizer_state_dict': optimizer.state_dict(),
-                'val_loss': val_metrics['loss'],
-                'train_loss': train_metrics['loss'],
-                'args': vars(args),
-                'normalization': {
-                    'mean': full_dataset.mean.numpy().tolist(),
-                    'std': full_dataset.std.numpy().tolist()
+            # Teacher forcing ratio decay (a 0-d tensor, so torch.compile does not
+            # specialize on - and recompile for - each epoch's value)
+            teacher_forcing_ratio = torch.tensor(max(0.5 * (0.99 ** epoch), 0.1), device=device)
+            
+            # Train
+            train_metrics = train_epoch(
+                train_net, train_loader, criterion, optimizer, device, teacher_forcing_ratio,
+                scaler=scaler, amp_dtype=amp_dtype, accum_steps=args.accum_steps
+            )
+            
+            # Validate
+            val_metrics = validate(train_net, val_loader, criterion, device, amp_dtype=amp_dtype)
+            
+            # Learning rate scheduling
+            scheduler.step(val_metrics['loss'])
+            
+            # Print metrics
+            print(f"Train Loss: {train_metrics['loss']:.4f} | Val Loss: {val_metrics['loss']:.4f}")
+            print(f"  Recon: {train_metrics['reconstruction_loss']:.4f} | {val_metrics['reconstruction_loss']:.4f}")
+            print(f"  KL: {train_metrics['kl_loss']:.4f} | {val_metrics['kl_loss']:.4f}")
+            print(f"  Smooth: {train_metrics['smoothness_loss']:.4f} | {val_metrics['smoothness_loss']:.4f}")
+            print(f"  Boundary: {train_metrics['boundary_loss']:.4f} | {val_metrics['boundary_loss']:.4f}")
+            
+            # TensorBoard logging
+            for k, v in train_metrics.items():
+                writer.add_scalar(f'train/{k}', v, epoch)
+            for k, v in val_metrics.items():
+                writer.add_scalar(f'val/{k}', v, epoch)
+            writer.add_scalar('learning_rate', optimizer.param_groups[0]['lr'], epoch)
+            
+            # Save best model
+            if val_metrics['loss'] < best_val_loss:
+                best_val_loss = val_metrics['loss']
+                patience_counter = 0
+                
+                # The CPU weight buffer is reused, so let the previous save finish first
+                if pending_save is not None:
+                    pending_save.result()
+                
+                checkpoint = {
+                    'epoch': epoch,
+                    'model_state_dict': snapshot_state_dict(model, cpu_model_buffer),
+                    'optimizer_state_dict': state_to_cpu(optimizer.state_dict()),
+                    'val_loss': val_metrics['loss'],
+                    'train_loss': train_metrics['loss'],
+                    'args': vars(args),
+                    'normalization': {
+                        'mean': full_dataset.mean.numpy().tolist(),
+                        'std': full_dataset.std.numpy().tolist()
+                    }
                 }
-            }
+                
+                save_path = os.path.join(args.save_dir, 'best_model.pth')
+                pending_save = ckpt_pool.submit(torch.save, checkpoint, save_path)
+                print(f"✓ Queued save of best model to {save_path}")
+            else:
+                patience_counter += 1
             
-            save_path = os.path.join(args.save_dir, 'best_model.pth')
-            torch.save(checkpoint, save_path)
-            print(f"✓ Saved best model to {save_path}")
-        else:
-            patience_counter += 1
-        
-        # Save latest model
-        if (epoch + 1) % args.save_interval == 0:
-            checkpoint = {
-                'epoch': epoch,
-                'model_state_dict': model.state_dict(),
-                'optimizer_state_dict': optimizer.state_dict(),
-                'val_loss': val_metrics['loss'],
-                'train_loss': train_metrics['loss'],
-                'args': vars(args),
-                'normalization': {
-                    'mean': full_dataset.mean.numpy().tolist(),
-                    'std': full_dataset.std.numpy().tolist()
+            # Save latest model
+            if (epoch + 1) % args.save_interval == 0:
+                # The CPU weight buffer is reused, so let the previous save finish first
+                if pending_save is not None:
+                    pending_save.result()
+                
+                checkpoint = {
+                    'epoch': epoch,
+                    'model_state_dict': snapshot_state_dict(model, cpu_model_buffer),
+                    'optimizer_state_dict': state_to_cpu(optimizer.state_dict()),
+                    'val_loss': val_metrics['loss'],
+                    'train_loss': train_metrics['loss'],
+                    'args': vars(args),
+                    'normalization': {
+                        'mean': full_dataset.mean.numpy().tolist(),
+                        'std': full_dataset.std.numpy().tolist()
+                    }
                 }
-            }
+                
+                save_path = os.path.join(args.save_dir, f'checkpoint_epoch_{epoch+1}.pth')
+                pending_save = ckpt_pool.submit(torch.save, checkpoint, save_path)
+                print(f"✓ Queued save of checkpoint to {save_path}")
             
-            save_path = os.path.join(args.save_dir, f'checkpoint_epoch_{epoch+1}.pth')
-            torch.save(checkpoint, save_path)
-            print(f"✓ Saved checkpoint to {save_path}")
+            # Early stopping
+            if patience_counter >= args.patience:
+                print(f"\nEarly stopping triggered after {epoch + 1} epochs")
+                writer.flush()
+                break
         
-        # Early stopping
-        if patience_counter >= args.patience:
-            print(f"\nEarly stopping triggered after {epoch + 1} epochs")
-            break
+        # shutdown() would swallow a failed final write; surface it here
+        if pending_save is not None:
+            pending_save.result()
+    finally:
+        writer.close()
+        ckpt_pool.shutdown(wait=True)
     
-    writer.close()
     print("\n" + "=" * 60)
     print("Training completed!")
     print(f"Best validation loss: {best_val_loss:.4f}")
@@ -385,7 +633,11 @@ def train_model(args):
 
 
 def main():
-    parser = argparse.ArgumentParser(description='Train trajectory generation model')
+    parser = argparse.ArgumentParser(
+        description='Train trajectory generation model',
+        epilog='The CUDA caching allocator uses expandable_segments:True unless '
+               'PYTORCH_CUDA_ALLOC_CONF is already set (e.g. set it to "" when using CUDA IPC).'
+    )
     
     # Data
     parser.add_argument('--data_path', type=str, default='data/trajectories.npz',
@@ -412,12 +664,25 @@ def main():
                        help='Number of training epochs')
     parser.add_argument('--batch_size', type=int, default=64,
                        help='Batch size')
+    parser.add_argument('--accum_steps', type=int, default=1,
+                       help='Accumulate gradients over N batches per optimizer step')
     parser.add_argument('--lr', type=float, default=0.001,
                        help='Learning rate')
     parser.add_argument('--weight_decay', type=float, default=1e-5,
                        help='Weight decay')
     parser.add_argument('--patience', type=int, default=15,
                        help='Early stopping patience')
+    parser.add_argument('--compile', action='store_true',
+                       help='Compile model and loss with torch.compile')
+    parser.add_argument('--compile_mode', type=str, default='default',
+                       choices=['default', 'reduce-overhead', 'max-autotune'],
+                       help='torch.compile mode (reduce-overhead/max-autotune use CUDA graphs and more memory)')
+    parser.add_argument('--amp', action='store_true',
+                       help='Train with autocast mixed precision (float16 + GradScaler by default)')
+    parser.add_argument('--bf16', action='store_true',
+                       help='Use bfloat16 instead of float16 for --amp')
+    parser.add_argument('--input_fp16', action='store_true',
+                       help='Store the dataset as float16 (upcast to float32 on device)')
     
     # Misc
     parser.add_argument('--save_dir', type=str, default='models',
@@ -4,142 +4,371 @@ PyQt5-based interactive GUI for generating and visualizing various trajectory ty
 """
 
 # Suppress NumPy MINGW-W64 warnings on Windows
+import sys
 import warnings
 
 # Filter warnings before NumPy import to suppress MINGW-W64 build warnings
-warnings.filterwarnings('ignore', message='.*MINGW-W64.*')
+if sys.platform == 'win32':
+    warnings.filterwarnings('ignore', message='.*MINGW-W64.*')
 warnings.filterwarnings('ignore', category=RuntimeWarning, module='numpy')
 warnings.filterwarnings('ignore', message='.*invalid value encountered.*')
 
-import sys
 import numpy as np
 from typing import List, Dict, Tuple, Optional
 import json
+import copy
+import functools
+import operator
+from collections import OrderedDict
+from dataclasses import dataclass, asdict, fields
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QComboBox, QGroupBox,
-    QGridLayout, QDoubleSpinBox, QSpinBox, QCheckBox,
-    QTabWidget, QTextEdit, QSplitter, QFileDialog, QMessageBox,
+    QFormLayout, QDoubleSpinBox, QSpinBox, QCheckBox,
+    QTabWidget, QTextEdit, QPlainTextEdit, QSplitter, QFileDialog, QMessageBox,
     QScrollArea, QSlider
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, QTimer, QObject, QRunnable, QThreadPool, QSignalBlocker, QLocale, QSettings
+)
 from PyQt5.QtGui import QFont, QColor
 
 import pyqtgraph as pg
-import pyqtgraph.opengl as gl
-from pyqtgraph.opengl import GLViewWidget, GLLinePlotItem, GLScatterPlotItem, GLGridItem, GLAxisItem
+
+# pyqtgraph.opengl pulls in PyOpenGL and compiles shaders on import; it is
+# loaded by the first Visualizer3D so generator-only users never pay for it
+gl = None
+
+# Line and grid item classes used by Visualizer3D, chosen when gl is imported
+_LinePlotItem = None
+_GridItem = None
+
+
+def _import_gl():
+    """Import pyqtgraph.opengl on first use"""
+    global gl, _LinePlotItem, _GridItem
+    if gl is None:
+        import pyqtgraph.opengl as gl_module
+        gl = gl_module
+        _LinePlotItem, _GridItem = _vbo_gl_items(gl_module)
+    return gl
+
+
+def _vbo_gl_items(gl_module):
+    """
+    (line item, grid item) classes keeping their vertices in GL buffer objects
+    
+    pyqtgraph before 0.14 (the pinned 0.13.x) draws line items from client
+    side arrays and the grid in immediate mode (one Python glVertex3f call
+    per endpoint), redoing either on every repaint (camera moves, resizes).
+    The subclasses upload vertices once per data/size change and draw from
+    the buffer. pyqtgraph 0.14+ already buffers both and is used unchanged.
+    """
+    if hasattr(gl_module.GLLinePlotItem, 'upload_vbo'):
+        return gl_module.GLLinePlotItem, gl_module.GLGridItem
+    
+    from OpenGL import GL
+    
+    class StaticVertexBuffer:
+        """Vertex buffer uploaded on first paint and after _vbo_dirty is set"""
+        _vbo = None
+        _vbo_dirty = True
+        _vertex_count = 0
+        
+        def _bind_vertices(self, vertices):
+            """Enable the vertex array, sourced from the (re)uploaded buffer"""
+            if self._vbo is None:
+                self._vbo = GL.glGenBuffers(1)
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self._vbo)
+            if self._vbo_dirty:
+                GL.glBufferData(GL.GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL.GL_STATIC_DRAW)
+                self._vertex_count = len(vertices)
+                self._vbo_dirty = False
+            GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+            GL.glVertexPointer(3, GL.GL_FLOAT, 0, None)
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+        
+        def release_vbo(self):
+            """Free the vertex buffer (the view's GL context must be current)"""
+            if self._vbo is not None:
+                GL.glDeleteBuffers(1, [self._vbo])
+                self._vbo = None
+                self._vbo_dirty = True
+    
+    def enable_antialiasing():
+        GL.glEnable(GL.GL_LINE_SMOOTH)
+        GL.glEnable(GL.GL_BLEND)
+        GL.glBlendFunc(GL.GL_SRC_ALPHA, GL.GL_ONE_MINUS_SRC_ALPHA)
+        GL.glHint(GL.GL_LINE_SMOOTH_HINT, GL.GL_NICEST)
+    
+    class VBOLinePlotItem(StaticVertexBuffer, gl_module.GLLinePlotItem):
+        def setData(self, **kwds):
+            if 'pos' in kwds:
+                self._vbo_dirty = True
+            super().setData(**kwds)
+        
+        def paint(self):
+            if self.pos is None:
+                return
+            self.setupGLState()
+            
+            try:
+                self._bind_vertices(self.pos)
+                
+                if isinstance(self.color, np.ndarray):
+                    GL.glEnableClientState(GL.GL_COLOR_ARRAY)
+                    GL.glColorPointerf(self.color)
+                elif isinstance(self.color, tuple):
+                    GL.glColor4f(*self.color)
+                else:
+                    GL.glColor4f(*pg.mkColor(self.color).getRgbF())
+                GL.glLineWidth(self.width)
+                
+                if self.antialias:
+                    enable_antialiasing()
+                
+                mode = GL.GL_LINES if self.mode == 'lines' else GL.GL_LINE_STRIP
+                GL.glDrawArrays(mode, 0, self.pos.shape[0])
+            finally:
+                GL.glDisableClientState(GL.GL_COLOR_ARRAY)
+                GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+    
+    class VBOGridItem(StaticVertexBuffer, gl_module.GLGridItem):
+        def setSize(self, x=None, y=None, z=None, size=None):
+            super().setSize(x, y, z, size)
+            self._vbo_dirty = True
+        
+        def setSpacing(self, x=None, y=None, z=None, spacing=None):
+            super().setSpacing(x, y, z, spacing)
+            self._vbo_dirty = True
+        
+        def _grid_vertices(self) -> np.ndarray:
+            """Endpoints of the lines along y, then along x, as [2 * n_lines, 3] float32"""
+            x, y, _ = self.size()
+            xs, ys, _ = self.spacing()
+            xvals = np.arange(-x / 2., x / 2. + xs * 0.001, xs)
+            yvals = np.arange(-y / 2., y / 2. + ys * 0.001, ys)
+            
+            nx = len(xvals)
+            vertices = np.zeros((2 * (nx + len(yvals)), 3), dtype=np.float32)
+            vertices[0:2 * nx:2, 0] = vertices[1:2 * nx:2, 0] = xvals
+            vertices[0:2 * nx:2, 1] = yvals[0]
+            vertices[1:2 * nx:2, 1] = yvals[-1]
+            vertices[2 * nx::2, 1] = vertices[2 * nx + 1::2, 1] = yvals
+            vertices[2 * nx::2, 0] = xvals[0]
+            vertices[2 * nx + 1::2, 0] = xvals[-1]
+            return vertices
+        
+        def paint(self):
+            self.setupGLState()
+            
+            if self.antialias:
+                enable_antialiasing()
+            
+            # Endpoints are only recomputed when size or spacing changed
+            vertices = self._grid_vertices() if self._vbo_dirty else None
+            try:
+                self._bind_vertices(vertices)
+                GL.glColor4f(*self.color().getRgbF())
+                GL.glDrawArrays(GL.GL_LINES, 0, self._vertex_count)
+            finally:
+                GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+    
+    return VBOLinePlotItem, VBOGridItem
+
+
+# Optional orjson for fast JSON export (serializes ndarrays directly)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional Numba acceleration for trajectory metrics
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 
+def _metrics_kernel_python(trajectory: np.ndarray) -> Tuple[float, np.ndarray]:
+    """Path length and per-vertex curvatures of a [n, 3] trajectory"""
+    # Segment vectors and lengths, computed once for both metrics
+    diffs = np.diff(trajectory, axis=0)
+    seg_lens = np.linalg.norm(diffs, axis=1)
+    
+    # Path length
+    path_length = float(seg_lens.sum())
+    
+    # Curvature at interior vertices with non-degenerate adjacent segments
+    norm1 = seg_lens[:-1]
+    norm2 = seg_lens[1:]
+    valid = (norm1 > 1e-6) & (norm2 > 1e-6)
+    
+    cos_angles = np.einsum('ij,ij->i', diffs[:-1][valid], diffs[1:][valid]) / (norm1[valid] * norm2[valid])
+    curvatures = np.arccos(np.clip(cos_angles, -1, 1)) / norm1[valid]
+    
+    return path_length, curvatures
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _metrics_kernel_numba(trajectory):
+        """Single-pass path length and curvatures, reusing each segment length"""
+        n = trajectory.shape[0]
+        path_length = 0.0
+        curvatures = np.empty(max(n - 2, 0))
+        count = 0
+        
+        prev_dx = prev_dy = prev_dz = 0.0
+        prev_len = 0.0
+        for i in range(n - 1):
+            dx = trajectory[i+1, 0] - trajectory[i, 0]
+            dy = trajectory[i+1, 1] - trajectory[i, 1]
+            dz = trajectory[i+1, 2] - trajectory[i, 2]
+            seg_len = np.sqrt(dx * dx + dy * dy + dz * dz)
+            path_length += seg_len
+            
+            if i > 0 and prev_len > 1e-6 and seg_len > 1e-6:
+                cos_angle = (prev_dx * dx + prev_dy * dy + prev_dz * dz) / (prev_len * seg_len)
+                cos_angle = min(max(cos_angle, -1.0), 1.0)
+                curvatures[count] = np.arccos(cos_angle) / prev_len
+                count += 1
+            
+            prev_dx, prev_dy, prev_dz, prev_len = dx, dy, dz, seg_len
+        
+        return path_length, curvatures[:count]
+
+
+def _metrics_kernel(trajectory: np.ndarray) -> Tuple[float, np.ndarray]:
+    """Dispatch to the Numba kernel when available, else the NumPy implementation"""
+    # Metrics are accumulated in float64 even for float32 trajectories
+    trajectory = np.ascontiguousarray(trajectory, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _metrics_kernel_numba(trajectory)
+    return _metrics_kernel_python(trajectory)
+
+
+# Coordinates that to_dict() packs into 'start' / 'end' lists
+_POINT_FIELDS = ('start_x', 'start_y', 'start_z', 'end_x', 'end_y', 'end_z')
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class TrajectoryParameters:
     """Parameters for trajectory generation"""
-    def __init__(self):
-        # Start and end points
-        self.start_x = 0.0
-        self.start_y = 0.0
-        self.start_z = 100.0
-        
-        self.end_x = 800.0
-        self.end_y = 600.0
-        self.end_z = 200.0
-        
-        # Physical constraints
-        self.max_altitude = 500.0
-        self.min_altitude = 50.0
-        self.max_speed = 250.0  # m/s
-        self.max_acceleration = 50.0  # m/s^2
-        self.max_g_turn = 4.0  # g's
-        self.turn_radius = 100.0  # meters
-        
-        # Trajectory parameters
-        self.n_waypoints = 50
-        self.trajectory_type = "bezier"
-        self.smoothness = 0.8
-        self.curvature_limit = 0.01  # rad/m
-        
-        # Advanced parameters
-        self.banking_angle = 30.0  # degrees
-        self.climb_rate = 10.0  # m/s
-        self.descent_rate = 8.0  # m/s
-        
+    # Start and end points
+    start_x: float = 0.0
+    start_y: float = 0.0
+    start_z: float = 100.0
+    
+    end_x: float = 800.0
+    end_y: float = 600.0
+    end_z: float = 200.0
+    
+    # Physical constraints
+    max_altitude: float = 500.0
+    min_altitude: float = 50.0
+    max_speed: float = 250.0  # m/s
+    max_acceleration: float = 50.0  # m/s^2
+    max_g_turn: float = 4.0  # g's
+    turn_radius: float = 100.0  # meters
+    
+    # Trajectory parameters
+    n_waypoints: int = 50
+    trajectory_type: str = "bezier"
+    smoothness: float = 0.8
+    curvature_limit: float = 0.01  # rad/m
+    
+    # Advanced parameters
+    banking_angle: float = 30.0  # degrees
+    climb_rate: float = 10.0  # m/s
+    descent_rate: float = 8.0  # m/s
+    
     def to_dict(self) -> Dict:
         """Convert parameters to dictionary"""
-        return {
-            'start': [self.start_x, self.start_y, self.start_z],
-            'end': [self.end_x, self.end_y, self.end_z],
-            'max_altitude': self.max_altitude,
-            'min_altitude': self.min_altitude,
-            'max_speed': self.max_speed,
-            'max_acceleration': self.max_acceleration,
-            'max_g_turn': self.max_g_turn,
-            'turn_radius': self.turn_radius,
-            'n_waypoints': self.n_waypoints,
-            'trajectory_type': self.trajectory_type,
-            'smoothness': self.smoothness,
-            'curvature_limit': self.curvature_limit,
-            'banking_angle': self.banking_angle,
-            'climb_rate': self.climb_rate,
-            'descent_rate': self.descent_rate
-        }
+        data = asdict(self)
+        start = [data.pop('start_x'), data.pop('start_y'), data.pop('start_z')]
+        end = [data.pop('end_x'), data.pop('end_y'), data.pop('end_z')]
+        return {'start': start, 'end': end, **data}
     
     def from_dict(self, data: Dict):
         """Load parameters from dictionary"""
         self.start_x, self.start_y, self.start_z = data['start']
         self.end_x, self.end_y, self.end_z = data['end']
-        self.max_altitude = data['max_altitude']
-        self.min_altitude = data['min_altitude']
-        self.max_speed = data['max_speed']
-        self.max_acceleration = data['max_acceleration']
-        self.max_g_turn = data['max_g_turn']
-        self.turn_radius = data['turn_radius']
-        self.n_waypoints = data['n_waypoints']
-        self.trajectory_type = data['trajectory_type']
-        self.smoothness = data['smoothness']
-        self.curvature_limit = data['curvature_limit']
-        self.banking_angle = data['banking_angle']
-        self.climb_rate = data['climb_rate']
-        self.descent_rate = data['descent_rate']
+        for f in fields(self):
+            if f.name not in _POINT_FIELDS:
+                setattr(self, f.name, data[f.name])
+    
+    def cache_key(self) -> Tuple:
+        """Hashable snapshot of all parameters, used to memoize generation"""
+        return _get_numeric_fields(self) + (self.trajectory_type.lower(),)
+
+
+# Every field except the (case-normalized) trajectory type, read in one C call;
+# derived from the dataclass so new fields are picked up by cache_key()
+_get_numeric_fields = operator.attrgetter(*(
+    f.name for f in fields(TrajectoryParameters) if f.name != 'trajectory_type'
+))
 
 
 class Advanced3DTrajectoryGenerator:
     """Advanced trajectory generation with various patterns"""
     
+    # Cubic Bezier basis matrix: B(t) = [1, t, t^2, t^3] @ M @ P
+    _CUBIC_BEZIER_MATRIX = np.array([
+        [1, 0, 0, 0],
+        [-3, 3, 0, 0],
+        [3, -6, 3, 0],
+        [-1, 3, -3, 1]
+    ], dtype=np.float64)
+    
+    # Number of generated trajectories kept in the memoization cache
+    CACHE_SIZE = 32
+    
     def __init__(self):
         self.gravity = 9.81  # m/s^2
+        self._cache: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()
+        
+        # np.linspace(0, 1, n) per waypoint count, shared by all generators
+        self._alpha_cache: Dict[int, np.ndarray] = {}
     
     def generate_trajectory(self, params: TrajectoryParameters) -> np.ndarray:
-        """Generate trajectory based on type"""
+        """
+        Generate trajectory based on type
+        
+        Results are memoized on the full parameter set, so regenerating with
+        unchanged parameters skips the computation. The cache keeps float64
+        points (metrics need full precision) and each call returns a fresh,
+        writable copy; display and save paths downcast to float32 themselves.
+        """
+        key = params.cache_key()
+        trajectory = self._cache.get(key)
+        if trajectory is not None:
+            self._cache.move_to_end(key)
+            return trajectory.copy()
+        
+        trajectory = self._generate_uncached(params)
+        trajectory.flags.writeable = False
+        
+        self._cache[key] = trajectory
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        
+        return trajectory.copy()
+    
+    def _generate_uncached(self, params: TrajectoryParameters) -> np.ndarray:
+        """Dispatch to the generator for params.trajectory_type"""
         start = np.array([params.start_x, params.start_y, params.start_z])
         end = np.array([params.end_x, params.end_y, params.end_z])
         
-        trajectory_type = params.trajectory_type.lower()
-        
-        if trajectory_type == "bezier":
-            return self.generate_bezier(start, end, params)
-        elif trajectory_type == "circular":
-            return self.generate_circular(start, end, params)
-        elif trajectory_type == "ascending_spiral":
-            return self.generate_ascending_spiral(start, end, params)
-        elif trajectory_type == "descending_spiral":
-            return self.generate_descending_spiral(start, end, params)
-        elif trajectory_type == "s_curve":
-            return self.generate_s_curve(start, end, params)
-        elif trajectory_type == "l_curve":
-            return self.generate_l_curve(start, end, params)
-        elif trajectory_type == "zigzag":
-            return self.generate_zigzag(start, end, params)
-        elif trajectory_type == "helix":
-            return self.generate_helix(start, end, params)
-        elif trajectory_type == "figure_eight":
-            return self.generate_figure_eight(start, end, params)
-        elif trajectory_type == "parabolic":
-            return self.generate_parabolic(start, end, params)
-        elif trajectory_type == "combat_maneuver":
-            return self.generate_combat_maneuver(start, end, params)
-        elif trajectory_type == "terrain_following":
-            return self.generate_terrain_following(start, end, params)
-        else:
-            return self.generate_bezier(start, end, params)
+        generator = self._GENERATORS.get(params.trajectory_type.lower(),
+                                         Advanced3DTrajectoryGenerator.generate_bezier)
+        return generator(self, start, end, params)
     
     def generate_bezier(self, start: np.ndarray, end: np.ndarray, 
                        params: TrajectoryParameters) -> np.ndarray:
@@ -163,8 +392,10 @@ class Advanced3DTrajectoryGenerator:
         
         control_points = np.array([start, control1, control2, end])
         
-        t = np.linspace(0, 1, n)
-        trajectory = self._bezier_curve(control_points, t)
+        # Horner evaluation in power basis: ((c3 * t + c2) * t + c1) * t + c0
+        c0, c1, c2, c3 = self._bezier_power_coeffs(control_points)
+        t = self._linspace_01(n)[:, None]
+        trajectory = c0 + t * (c1 + t * (c2 + t * c3))
         
         return trajectory
     
@@ -177,28 +408,25 @@ class Advanced3DTrajectoryGenerator:
         radius = np.linalg.norm(end - start) / 2
         
         # Create circular path in XY plane
-        angles = np.linspace(0, np.pi, n)
+        alpha = self._linspace_01(n)
+        angles = np.pi * alpha
         
-        # Direction vector
+        # Unit direction in the XY plane, as a complex rotation (zero for a
+        # vertical climb, which collapses the arc to the straight climb)
         direction = end - start
-        direction_xy = direction[:2] / np.linalg.norm(direction[:2])
-        
-        trajectory = np.zeros((n, 3))
-        for i, angle in enumerate(angles):
-            offset = radius * np.array([np.cos(angle), np.sin(angle), 0])
-            # Rotate offset to align with direction
-            cos_theta = direction_xy[0]
-            sin_theta = direction_xy[1]
-            rotated_offset = np.array([
-                offset[0] * cos_theta - offset[1] * sin_theta,
-                offset[0] * sin_theta + offset[1] * cos_theta,
-                offset[2]
-            ])
-            trajectory[i] = center + rotated_offset
-            
-            # Interpolate altitude
-            alpha = i / (n - 1)
-            trajectory[i, 2] = start[2] * (1 - alpha) + end[2] * alpha
+        rotation = complex(direction[0], direction[1])
+        if abs(rotation) > 0:
+            rotation /= abs(rotation)
+        
+        # Rotate offsets to align with direction (one complex multiply)
+        xy = complex(center[0], center[1]) + (radius * rotation) * np.exp(1j * angles)
+        
+        trajectory = np.empty((n, 3))
+        trajectory[:, 0] = xy.real
+        trajectory[:, 1] = xy.imag
+        
+        # Interpolate altitude
+        trajectory[:, 2] = start[2] * (1 - alpha) + end[2] * alpha
         
         return trajectory
     
@@ -212,18 +440,18 @@ class Advanced3DTrajectoryGenerator:
         radius = params.turn_radius
         n_turns = 2.0
         
-        angles = np.linspace(0, 2 * np.pi * n_turns, n)
+        alpha = self._linspace_01(n)
         
-        trajectory = np.zeros((n, 3))
-        for i, angle in enumerate(angles):
-            alpha = i / (n - 1)
-            
-            # Spiral outward
-            r = radius * (1 + alpha * 0.5)
-            
-            trajectory[i, 0] = center_xy[0] + r * np.cos(angle)
-            trajectory[i, 1] = center_xy[1] + r * np.sin(angle)
-            trajectory[i, 2] = start[2] + (end[2] - start[2]) * alpha
+        angles = 2 * np.pi * n_turns * alpha
+        
+        # Spiral outward (cos/sin from one complex exponential)
+        r = radius * (1 + alpha * 0.5)
+        xy = complex(center_xy[0], center_xy[1]) + r * np.exp(1j * angles)
+        
+        trajectory = np.empty((n, 3))
+        trajectory[:, 0] = xy.real
+        trajectory[:, 1] = xy.imag
+        trajectory[:, 2] = start[2] + (end[2] - start[2]) * alpha
         
         return trajectory
     
@@ -236,18 +464,18 @@ class Advanced3DTrajectoryGenerator:
         radius = params.turn_radius
         n_turns = 2.0
         
-        angles = np.linspace(0, 2 * np.pi * n_turns, n)
+        alpha = self._linspace_01(n)
         
-        trajectory = np.zeros((n, 3))
-        for i, angle in enumerate(angles):
-            alpha = i / (n - 1)
-            
-            # Spiral inward
-            r = radius * (1 - alpha * 0.3)
-            
-            trajectory[i, 0] = center_xy[0] + r * np.cos(angle)
-            trajectory[i, 1] = center_xy[1] + r * np.sin(angle)
-            trajectory[i, 2] = start[2] - (start[2] - end[2]) * alpha
+        angles = 2 * np.pi * n_turns * alpha
+        
+        # Spiral inward (cos/sin from one complex exponential)
+        r = radius * (1 - alpha * 0.3)
+        xy = complex(center_xy[0], center_xy[1]) + r * np.exp(1j * angles)
+        
+        trajectory = np.empty((n, 3))
+        trajectory[:, 0] = xy.real
+        trajectory[:, 1] = xy.imag
+        trajectory[:, 2] = start[2] - (start[2] - end[2]) * alpha
         
         return trajectory
     
@@ -256,29 +484,13 @@ class Advanced3DTrajectoryGenerator:
         """Generate S-curve trajectory"""
         n = params.n_waypoints
         
-        direction = end - start
-        distance = np.linalg.norm(direction[:2])
+        t = self._linspace_01(n)
         
-        t = np.linspace(0, 1, n)
-        
-        # S-curve using sigmoid
+        # S-curve using sigmoid along the main direction, plus lateral S-curve
         s_curve = 1 / (1 + np.exp(-12 * (t - 0.5)))
+        lateral_offset = params.turn_radius * np.sin(t * np.pi)
         
-        trajectory = np.zeros((n, 3))
-        for i in range(n):
-            alpha = s_curve[i]
-            
-            # Linear interpolation along main direction
-            trajectory[i] = start + direction * alpha
-            
-            # Add lateral S-curve
-            lateral_offset = params.turn_radius * np.sin(t[i] * np.pi)
-            perpendicular = np.array([-direction[1], direction[0], 0])
-            if np.linalg.norm(perpendicular) > 0:
-                perpendicular = perpendicular / np.linalg.norm(perpendicular)
-                trajectory[i, :2] += perpendicular[:2] * lateral_offset
-        
-        return trajectory
+        return self._parametric_sweep(start, end, s_curve, lateral=lateral_offset)
     
     def generate_l_curve(self, start: np.ndarray, end: np.ndarray,
                         params: TrajectoryParameters) -> np.ndarray:
@@ -293,26 +505,15 @@ class Advanced3DTrajectoryGenerator:
         n2 = n - n1
         
         # First segment: start to corner
-        t1 = np.linspace(0, 1, n1)
-        seg1 = np.zeros((n1, 3))
-        for i, t in enumerate(t1):
-            seg1[i] = start * (1 - t) + corner * t
+        t1 = self._linspace_01(n1)[:, None]
+        seg1 = start * (1 - t1) + corner * t1
         
         # Second segment: corner to end
-        t2 = np.linspace(0, 1, n2)
-        seg2 = np.zeros((n2, 3))
-        for i, t in enumerate(t2):
-            seg2[i] = corner * (1 - t) + end * t
+        t2 = self._linspace_01(n2)[:, None]
+        seg2 = corner * (1 - t2) + end * t2
         
         trajectory = np.vstack([seg1, seg2])
         
-        # Smooth the corner
-        from scipy.interpolate import CubicSpline
-        indices = np.arange(len(trajectory))
-        cs = CubicSpline(indices, trajectory, bc_type='natural')
-        smooth_indices = np.linspace(0, len(trajectory) - 1, n)
-        trajectory = cs(smooth_indices)
-        
         return trajectory
     
     def generate_zigzag(self, start: np.ndarray, end: np.ndarray,
@@ -321,23 +522,12 @@ class Advanced3DTrajectoryGenerator:
         n = params.n_waypoints
         n_zigs = 3
         
-        direction = end - start
-        perpendicular = np.array([-direction[1], direction[0], 0])
-        if np.linalg.norm(perpendicular) > 0:
-            perpendicular = perpendicular / np.linalg.norm(perpendicular)
+        alpha = self._linspace_01(n)
         
-        trajectory = np.zeros((n, 3))
-        for i in range(n):
-            alpha = i / (n - 1)
-            
-            # Base position
-            trajectory[i] = start + direction * alpha
-            
-            # Zigzag offset
-            zig_offset = params.turn_radius * np.sin(alpha * n_zigs * 2 * np.pi)
-            trajectory[i, :2] += perpendicular[:2] * zig_offset
+        # Zigzag offset
+        zig_offset = params.turn_radius * np.sin(alpha * n_zigs * 2 * np.pi)
         
-        return trajectory
+        return self._parametric_sweep(start, end, alpha, lateral=zig_offset)
     
     def generate_helix(self, start: np.ndarray, end: np.ndarray,
                       params: TrajectoryParameters) -> np.ndarray:
@@ -346,31 +536,26 @@ class Advanced3DTrajectoryGenerator:
         n_turns = 3.0
         
         direction = end - start
-        distance = np.linalg.norm(direction[:2])
         
-        angles = np.linspace(0, 2 * np.pi * n_turns, n)
+        alpha = self._linspace_01(n)
         
-        trajectory = np.zeros((n, 3))
-        for i, angle in enumerate(angles):
-            alpha = i / (n - 1)
-            
-            # Helix around axis
-            radius = params.turn_radius * 0.5
-            
-            # Direction along path
-            trajectory[i] = start + direction * alpha
-            
-            # Add circular component
-            perpendicular1 = np.array([-direction[1], direction[0], 0])
-            if np.linalg.norm(perpendicular1) > 0:
-                perpendicular1 = perpendicular1 / np.linalg.norm(perpendicular1)
-            
-            perpendicular2 = np.cross(direction, perpendicular1)
-            if np.linalg.norm(perpendicular2) > 0:
-                perpendicular2 = perpendicular2 / np.linalg.norm(perpendicular2)
-            
-            offset = radius * (np.cos(angle) * perpendicular1 + np.sin(angle) * perpendicular2)
-            trajectory[i] += offset
+        angles = 2 * np.pi * n_turns * alpha
+        
+        # Helix around axis
+        radius = params.turn_radius * 0.5
+        
+        # cos/sin of the helix angle from one complex exponential
+        rotation = radius * np.exp(1j * angles)
+        
+        # Circular component: lateral (in-plane) part via the sweep...
+        trajectory = self._parametric_sweep(start, end, alpha, lateral=rotation.real)
+        
+        # ...and the part along the second perpendicular of the frame
+        perpendicular2 = np.cross(direction, self._lateral_unit(direction))
+        perp2_norm = np.linalg.norm(perpendicular2)
+        if perp2_norm > 0:
+            perpendicular2 = perpendicular2 / perp2_norm
+        trajectory += rotation.imag[:, None] * perpendicular2
         
         return trajectory
     
@@ -382,19 +567,21 @@ class Advanced3DTrajectoryGenerator:
         center = (start + end) / 2
         radius = params.turn_radius
         
-        t = np.linspace(0, 2 * np.pi, n)
+        alpha = self._linspace_01(n)
+        t = 2 * np.pi * alpha
         
-        trajectory = np.zeros((n, 3))
-        for i, angle in enumerate(t):
-            # Lemniscate of Bernoulli
-            scale = radius / (1 + np.sin(angle)**2)
-            
-            trajectory[i, 0] = center[0] + scale * np.cos(angle)
-            trajectory[i, 1] = center[1] + scale * np.sin(angle) * np.cos(angle)
-            
-            # Altitude variation
-            alpha = i / (n - 1)
-            trajectory[i, 2] = start[2] * (1 - alpha) + end[2] * alpha
+        rotation = np.exp(1j * t)
+        cos_t, sin_t = rotation.real, rotation.imag
+        
+        # Lemniscate of Bernoulli: x + iy = r cos(t) (1 + i sin(t)) / (1 + sin(t)^2)
+        xy = complex(center[0], center[1]) + (radius * cos_t / (1 + sin_t**2)) * (1 + 1j * sin_t)
+        
+        trajectory = np.empty((n, 3))
+        trajectory[:, 0] = xy.real
+        trajectory[:, 1] = xy.imag
+        
+        # Altitude variation
+        trajectory[:, 2] = start[2] * (1 - alpha) + end[2] * alpha
         
         return trajectory
     
@@ -403,21 +590,16 @@ class Advanced3DTrajectoryGenerator:
         """Generate parabolic trajectory (ballistic-like)"""
         n = params.n_waypoints
         
-        trajectory = np.zeros((n, 3))
-        for i in range(n):
-            alpha = i / (n - 1)
-            
-            # Linear interpolation in XY
-            trajectory[i, :2] = start[:2] * (1 - alpha) + end[:2] * alpha
-            
-            # Parabolic altitude
-            peak_altitude = max(start[2], end[2]) + params.turn_radius
-            trajectory[i, 2] = (start[2] * (1 - alpha) + end[2] * alpha + 
-                               4 * peak_altitude * alpha * (1 - alpha))
-            
-            # Clamp altitude
-            trajectory[i, 2] = np.clip(trajectory[i, 2], 
-                                      params.min_altitude, params.max_altitude)
+        alpha = self._linspace_01(n)
+        
+        # Parabolic altitude on top of the linear sweep
+        peak_altitude = max(start[2], end[2]) + params.turn_radius
+        trajectory = self._parametric_sweep(start, end, alpha,
+                                            vertical=4 * peak_altitude * alpha * (1 - alpha))
+        
+        # Clamp altitude
+        np.clip(trajectory[:, 2], params.min_altitude, params.max_altitude,
+                out=trajectory[:, 2])
         
         return trajectory
     
@@ -430,31 +612,28 @@ class Advanced3DTrajectoryGenerator:
         n_climb = n // 2
         n_roll = n - n_climb
         
-        trajectory = np.zeros((n, 3))
+        trajectory = np.empty((n, 3))
         
         direction = end - start
         midpoint = start + direction * 0.5
         
         # Climb phase - vertical loop
-        for i in range(n_climb):
-            alpha = i / n_climb
-            angle = alpha * np.pi
-            
-            radius = params.turn_radius
-            
-            trajectory[i, :2] = start[:2] + direction[:2] * alpha * 0.5
-            trajectory[i, 2] = start[2] + radius * (1 - np.cos(angle))
+        alpha = np.arange(n_climb) / n_climb
+        angle = alpha * np.pi
+        
+        radius = params.turn_radius
+        
+        trajectory[:n_climb, :2] = start[:2] + direction[:2] * (alpha[:, None] * 0.5)
+        trajectory[:n_climb, 2] = start[2] + radius * (1 - np.cos(angle))
         
         # Roll phase - horizontal to end
-        for i in range(n_roll):
-            alpha = i / n_roll
-            idx = n_climb + i
-            
-            trajectory[idx] = midpoint * (1 - alpha) + end * alpha
-            
-            # Add rolling motion
-            roll_offset = params.turn_radius * 0.3 * np.sin(alpha * 2 * np.pi)
-            trajectory[idx, 1] += roll_offset
+        alpha = np.arange(n_roll) / n_roll
+        
+        trajectory[n_climb:] = midpoint * (1 - alpha[:, None]) + end * alpha[:, None]
+        
+        # Add rolling motion
+        roll_offset = params.turn_radius * 0.3 * np.sin(alpha * 2 * np.pi)
+        trajectory[n_climb:, 1] += roll_offset
         
         return trajectory
     
@@ -463,74 +642,92 @@ class Advanced3DTrajectoryGenerator:
         """Generate terrain-following trajectory with altitude variations"""
         n = params.n_waypoints
         
-        trajectory = np.zeros((n, 3))
+        alpha = self._linspace_01(n)
         
-        for i in range(n):
-            alpha = i / (n - 1)
-            
-            # Linear interpolation in XY
-            trajectory[i, :2] = start[:2] * (1 - alpha) + end[:2] * alpha
-            
-            # Simulated terrain following with sine waves
-            base_altitude = start[2] * (1 - alpha) + end[2] * alpha
-            
-            # Multiple frequency terrain variation
-            terrain_var = (30 * np.sin(alpha * 4 * np.pi) + 
-                          20 * np.sin(alpha * 8 * np.pi + 0.5) +
-                          10 * np.sin(alpha * 16 * np.pi))
-            
-            trajectory[i, 2] = base_altitude + terrain_var
-            
-            # Clamp altitude
-            trajectory[i, 2] = np.clip(trajectory[i, 2],
-                                      params.min_altitude, params.max_altitude)
+        # Simulated terrain following with multiple frequency sine waves
+        terrain_var = (30 * np.sin(alpha * 4 * np.pi) + 
+                       20 * np.sin(alpha * 8 * np.pi + 0.5) +
+                       10 * np.sin(alpha * 16 * np.pi))
+        
+        trajectory = self._parametric_sweep(start, end, alpha, vertical=terrain_var)
+        
+        # Clamp altitude
+        np.clip(trajectory[:, 2], params.min_altitude, params.max_altitude,
+                out=trajectory[:, 2])
         
         return trajectory
     
-    def _bezier_curve(self, control_points: np.ndarray, t: np.ndarray) -> np.ndarray:
-        """Evaluate Bezier curve"""
-        n = len(control_points) - 1
-        trajectory = np.zeros((len(t), 3))
+    # Trajectory type -> generator (unbound functions, called with self)
+    _GENERATORS = {
+        "bezier": generate_bezier,
+        "circular": generate_circular,
+        "ascending_spiral": generate_ascending_spiral,
+        "descending_spiral": generate_descending_spiral,
+        "s_curve": generate_s_curve,
+        "l_curve": generate_l_curve,
+        "zigzag": generate_zigzag,
+        "helix": generate_helix,
+        "figure_eight": generate_figure_eight,
+        "parabolic": generate_parabolic,
+        "combat_maneuver": generate_combat_maneuver,
+        "terrain_following": generate_terrain_following,
+    }
+    
+    def _linspace_01(self, n: int) -> np.ndarray:
+        """Cached read-only np.linspace(0, 1, n); scale it for other ranges"""
+        alpha = self._alpha_cache.get(n)
+        if alpha is None:
+            alpha = np.linspace(0, 1, n)
+            alpha.flags.writeable = False
+            self._alpha_cache[n] = alpha
+        return alpha
+    
+    def _parametric_sweep(self, start: np.ndarray, end: np.ndarray, alpha: np.ndarray,
+                          lateral: Optional[np.ndarray] = None,
+                          vertical: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Linear sweep from start to end plus optional offsets
+        
+        Args:
+            start: Start point [3]
+            end: End point [3]
+            alpha: Sweep parameter per waypoint [n], 0 at start and 1 at end
+            lateral: Horizontal offset perpendicular to the start->end direction [n]
+            vertical: Altitude offset [n]
+            
+        Returns:
+            trajectory: [n, 3]
+        """
+        alpha_col = alpha[:, None]
+        trajectory = start * (1 - alpha_col) + end * alpha_col
+        
+        if lateral is not None:
+            trajectory[:, :2] += lateral[:, None] * self._lateral_unit(end - start)[:2]
         
-        for i, t_val in enumerate(t):
-            point = np.zeros(3)
-            for j, cp in enumerate(control_points):
-                bernstein = self._bernstein_poly(j, n, t_val)
-                point += bernstein * cp
-            trajectory[i] = point
+        if vertical is not None:
+            trajectory[:, 2] += vertical
         
         return trajectory
     
-    def _bernstein_poly(self, i: int, n: int, t: float) -> float:
-        """Bernstein polynomial"""
-        from math import comb
-        return comb(n, i) * (t ** i) * ((1 - t) ** (n - i))
+    def _lateral_unit(self, direction: np.ndarray) -> np.ndarray:
+        """Unit horizontal vector perpendicular to direction (zero if direction is vertical)"""
+        perpendicular = np.array([-direction[1], direction[0], 0.0])
+        perp_norm = np.linalg.norm(perpendicular)
+        if perp_norm > 0:
+            perpendicular = perpendicular / perp_norm
+        return perpendicular
+    
+    def _bezier_power_coeffs(self, control_points: np.ndarray) -> np.ndarray:
+        """Convert cubic Bezier control points to power-basis coefficients [c0, c1, c2, c3]"""
+        return self._CUBIC_BEZIER_MATRIX @ control_points
     
     def calculate_metrics(self, trajectory: np.ndarray, params: TrajectoryParameters) -> Dict:
         """Calculate trajectory metrics"""
-        # Path length
-        path_length = 0.0
-        for i in range(len(trajectory) - 1):
-            path_length += np.linalg.norm(trajectory[i+1] - trajectory[i])
-        
-        # Curvature
-        curvatures = []
-        for i in range(1, len(trajectory) - 1):
-            v1 = trajectory[i] - trajectory[i-1]
-            v2 = trajectory[i+1] - trajectory[i]
-            
-            norm1 = np.linalg.norm(v1)
-            norm2 = np.linalg.norm(v2)
-            
-            if norm1 > 1e-6 and norm2 > 1e-6:
-                cos_angle = np.dot(v1, v2) / (norm1 * norm2)
-                cos_angle = np.clip(cos_angle, -1, 1)
-                angle = np.arccos(cos_angle)
-                curvature = angle / norm1
-                curvatures.append(curvature)
+        # Path length and curvature
+        path_length, curvatures = _metrics_kernel(trajectory)
         
-        avg_curvature = np.mean(curvatures) if curvatures else 0.0
-        max_curvature = np.max(curvatures) if curvatures else 0.0
+        avg_curvature = np.mean(curvatures) if len(curvatures) else 0.0
+        max_curvature = np.max(curvatures) if len(curvatures) else 0.0
         
         # G-forces (simplified)
         max_g_force = 0.0
@@ -557,6 +754,34 @@ class Advanced3DTrajectoryGenerator:
         }
 
 
+def qdebounced(timeout_ms: int):
+    """
+    Debounce a QObject method: a burst of calls collapses into one call
+    made timeout_ms after the last of them
+    
+    Each instance gets its own single-shot QTimer that every call restarts.
+    Signal arguments (e.g. QPushButton.clicked's checked flag) are ignored.
+    The undebounced method stays available as ``<method>.immediate``.
+    """
+    def decorator(method):
+        timer_attr = f'_{method.__name__}_debounce_timer'
+        
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            timer = getattr(self, timer_attr, None)
+            if timer is None:
+                timer = QTimer(self)
+                timer.setSingleShot(True)
+                timer.setInterval(timeout_ms)
+                timer.timeout.connect(lambda: method(self))
+                setattr(self, timer_attr, timer)
+            timer.start()
+        
+        wrapper.immediate = method
+        return wrapper
+    return decorator
+
+
 class Visualizer3D(QWidget):
     """3D visualization widget using PyQtGraph"""
     
@@ -571,6 +796,8 @@ class Visualizer3D(QWidget):
     
     def init_ui(self):
         """Initialize UI"""
+        _import_gl()
+        
         layout = QVBoxLayout()
         
         # Create 3D view
@@ -578,7 +805,7 @@ class Visualizer3D(QWidget):
         self.view.setBackgroundColor('k')
         
         # Add grid
-        self.grid = gl.GLGridItem()
+        self.grid = _GridItem()
         self.grid.scale(100, 100, 10)
         self.view.addItem(self.grid)
         
@@ -593,34 +820,29 @@ class Visualizer3D(QWidget):
     
     def add_axes(self):
         """Add coordinate axes"""
-        # X axis (red)
-        x_axis = gl.GLLinePlotItem(
-            pos=np.array([[0, 0, 0], [500, 0, 0]]),
-            color=(1, 0, 0, 1),
-            width=3
+        # X (red), Y (green) and Z (blue) axes as three segments of a single
+        # line item: one vertex buffer and one draw call instead of three
+        axis_pos = np.zeros((6, 3), dtype=np.float32)
+        axis_pos[[1, 3, 5], [0, 1, 2]] = 500
+        
+        axis_colors = np.repeat(np.eye(4, 4, dtype=np.float32)[:3], 2, axis=0)
+        axis_colors[:, 3] = 1
+        
+        axes = _LinePlotItem(
+            pos=axis_pos,
+            color=axis_colors,
+            width=3,
+            mode='lines'
         )
-        self.view.addItem(x_axis)
-        
-        # Y axis (green)
-        y_axis = gl.GLLinePlotItem(
-            pos=np.array([[0, 0, 0], [0, 500, 0]]),
-            color=(0, 1, 0, 1),
-            width=3
-        )
-        self.view.addItem(y_axis)
-        
-        # Z axis (blue)
-        z_axis = gl.GLLinePlotItem(
-            pos=np.array([[0, 0, 0], [0, 0, 500]]),
-            color=(0, 0, 1, 1),
-            width=3
-        )
-        self.view.addItem(z_axis)
+        self.view.addItem(axes)
     
     def add_trajectory(self, trajectory: np.ndarray, color=(0.5, 0.8, 1.0, 0.8)):
         """Add trajectory to visualization"""
+        # GL vertex buffers are float32; convert once rather than per item
+        trajectory = np.ascontiguousarray(trajectory, dtype=np.float32)
+        
         # Add trajectory line
-        traj_item = gl.GLLinePlotItem(
+        traj_item = _LinePlotItem(
             pos=trajectory,
             color=color,
             width=2,
@@ -629,34 +851,24 @@ class Visualizer3D(QWidget):
         self.view.addItem(traj_item)
         self.trajectory_items.append(traj_item)
         
-        # Add waypoint markers
-        waypoint_item = gl.GLScatterPlotItem(
-            pos=trajectory,
-            color=color,
-            size=5,
-            pxMode=True
-        )
-        self.view.addItem(waypoint_item)
-        self.waypoint_items.append(waypoint_item)
-        
-        # Add start and end markers
-        start_marker = gl.GLScatterPlotItem(
-            pos=trajectory[0:1],
-            color=(0, 1, 0, 1),
-            size=15,
-            pxMode=True
-        )
-        self.view.addItem(start_marker)
-        self.waypoint_items.append(start_marker)
+        # Waypoint, start and end markers as one scatter item (one upload, one draw call)
+        n = len(trajectory)
+        marker_colors = np.empty((n, 4), dtype=np.float32)
+        marker_colors[:] = color
+        marker_colors[0] = (0, 1, 0, 1)
+        marker_colors[-1] = (1, 0, 0, 1)
         
-        end_marker = gl.GLScatterPlotItem(
-            pos=trajectory[-1:],
-            color=(1, 0, 0, 1),
-            size=15,
+        marker_sizes = np.full(n, 5.0, dtype=np.float32)
+        marker_sizes[[0, -1]] = 15.0
+        
+        marker_item = gl.GLScatterPlotItem(
+            pos=trajectory,
+            color=marker_colors,
+            size=marker_sizes,
             pxMode=True
         )
-        self.view.addItem(end_marker)
-        self.waypoint_items.append(end_marker)
+        self.view.addItem(marker_item)
+        self.waypoint_items.append(marker_item)
         
         self.trajectories.append(trajectory)
     
@@ -665,14 +877,123 @@ class Visualizer3D(QWidget):
         for item in self.trajectory_items + self.waypoint_items:
             self.view.removeItem(item)
         
+        # Buffer-backed line items own GL memory that removal does not free
+        if hasattr(_LinePlotItem, 'release_vbo') and self.view.isValid():
+            self.view.makeCurrent()
+            for item in self.trajectory_items:
+                item.release_vbo()
+            self.view.doneCurrent()
+        
         self.trajectory_items.clear()
         self.waypoint_items.clear()
         self.trajectories.clear()
 
 
+class TrajectoryWorkerSignals(QObject):
+    """Signals emitted by TrajectoryWorker (QRunnable cannot define signals)"""
+    finished = pyqtSignal(int, object, dict)  # request id, trajectory ndarray, metrics
+    failed = pyqtSignal(int, str)  # request id, error message
+
+
+class TrajectoryWorker(QRunnable):
+    """Runs trajectory generation and metrics on a pool thread"""
+    
+    def __init__(self, request_id: int, generator: Advanced3DTrajectoryGenerator,
+                 params: TrajectoryParameters):
+        super().__init__()
+        self.request_id = request_id
+        self.generator = generator
+        self.params = params
+        self.signals = TrajectoryWorkerSignals()
+    
+    def run(self):
+        try:
+            trajectory = self.generator.generate_trajectory(self.params)
+            metrics = self.generator.calculate_metrics(trajectory, self.params)
+        except Exception as e:
+            self.signals.failed.emit(self.request_id, str(e))
+        else:
+            self.signals.finished.emit(self.request_id, trajectory, metrics)
+
+
 class TrajectoryGeneratorGUI(QMainWindow):
     """Main GUI window"""
     
+    # Trajectory types in combo order: (display name, generator key, description)
+    _TRAJ_TYPES = (
+        ("Bezier", "bezier",
+         "Smooth curve using Bezier control points. Good for general-purpose smooth paths."),
+        ("Circular", "circular",
+         "Circular arc connecting start and end points. Maintains constant turn rate."),
+        ("Ascending Spiral", "ascending_spiral",
+         "Spiral path gaining altitude. Useful for climb maneuvers with lateral displacement."),
+        ("Descending Spiral", "descending_spiral",
+         "Spiral path losing altitude. Useful for descent maneuvers with controlled rate."),
+        ("S-Curve", "s_curve",
+         "S-shaped lateral deviation while progressing to target. Good for evasive maneuvers."),
+        ("L-Curve", "l_curve",
+         "L-shaped path with sharp corner. Useful for waypoint navigation."),
+        ("Zigzag", "zigzag",
+         "Zigzag pattern with periodic lateral deviations. Useful for search patterns."),
+        ("Helix", "helix",
+         "Helical path around axis of motion. Combines forward progress with circular motion."),
+        ("Figure Eight", "figure_eight",
+         "Figure-eight pattern in 3D space. Complex aerobatic maneuver."),
+        ("Parabolic", "parabolic",
+         "Parabolic arc with peak altitude. Ballistic-style trajectory."),
+        ("Combat Maneuver", "combat_maneuver",
+         "Aggressive maneuver combining climb and roll. Immelmann turn-inspired."),
+        ("Terrain Following", "terrain_following",
+         "Path following simulated terrain variations. Low-altitude flight profile."),
+    )
+    
+    # Spinbox rows per group: (parameter, label, minimum, maximum, step, decimals);
+    # decimals=None builds an integer QSpinBox
+    _START_ROWS = (
+        ("start_x", "X (m):", -5000, 5000, 10, 2),
+        ("start_y", "Y (m):", -5000, 5000, 10, 2),
+        ("start_z", "Z (m):", 0, 2000, 10, 2),
+    )
+    _END_ROWS = (
+        ("end_x", "X (m):", -5000, 5000, 10, 2),
+        ("end_y", "Y (m):", -5000, 5000, 10, 2),
+        ("end_z", "Z (m):", 0, 2000, 10, 2),
+    )
+    _CONSTRAINT_ROWS = (
+        ("max_altitude", "Max Altitude (m):", 50, 5000, 50, 2),
+        ("min_altitude", "Min Altitude (m):", 0, 1000, 10, 2),
+        ("max_speed", "Max Speed (m/s):", 10, 1000, 10, 2),
+        ("max_g_turn", "Max G-Turn:", 1, 12, 0.5, 2),
+        ("turn_radius", "Turn Radius (m):", 10, 1000, 10, 2),
+        ("n_waypoints", "Number of Waypoints:", 10, 500, 10, None),
+    )
+    _ADVANCED_ROWS = (
+        ("smoothness", "Smoothness (0-1):", 0, 1, 0.1, 2),
+        ("max_acceleration", "Max Acceleration (m/s²):", 1, 200, 5, 2),
+        ("banking_angle", "Banking Angle (°):", 0, 90, 5, 2),
+        ("climb_rate", "Climb Rate (m/s):", 1, 50, 1, 2),
+        ("descent_rate", "Descent Rate (m/s):", 1, 50, 1, 2),
+        ("curvature_limit", "Curvature Limit (rad/m):", 0.001, 0.1, 0.001, 4),
+    )
+    
+    # Parameter tabs taller than this (px) are wrapped in a QScrollArea
+    _SCROLL_THRESHOLD = 600
+    
+    # Metrics panel text, filled from calculate_metrics()' dictionary
+    _METRICS_TMPL = (
+        "=== Trajectory Metrics ===\n\n"
+        "Path Length: {path_length:.2f} m\n"
+        "Straight Line Distance: {straight_line_distance:.2f} m\n"
+        "Path Efficiency: {path_efficiency:.2%}\n"
+        "\nAverage Curvature: {avg_curvature:.6f} rad/m\n"
+        "Maximum Curvature: {max_curvature:.6f} rad/m\n"
+        "Estimated Max G-Force: {max_g_force:.2f} g\n"
+        "\nMinimum Altitude: {min_altitude:.2f} m\n"
+        "Maximum Altitude: {max_altitude:.2f} m\n"
+        "Altitude Range: {altitude_range:.2f} m\n"
+        "\nNumber of Waypoints: {n_waypoints}\n"
+    )
+    
     def __init__(self):
         super().__init__()
         
@@ -680,7 +1001,43 @@ class TrajectoryGeneratorGUI(QMainWindow):
         self.generator = Advanced3DTrajectoryGenerator()
         self.current_trajectory = None
         
+        # Background generation: a single worker thread keeps requests ordered
+        # and the generator's cache single-threaded; stale results are dropped
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+        self._request_id = 0
+        
+        # cache_key() of the parameters last submitted for generation
+        self._last_key = None
+        
+        # Coalesce 3D redraws: a burst of results produces one add_trajectory
+        self._pending_trajectory = None
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(50)
+        self._redraw_timer.timeout.connect(self._flush_redraw)
+        
+        # Parameter name -> spinbox, filled by _build_spinbox_form
+        self._spinboxes: Dict[str, QWidget] = {}
+        
+        # One shared C locale for all spinboxes: '.' decimal point, no digit
+        # grouping, so text <-> value conversion skips locale formatting
+        self._spinbox_locale = QLocale.c()
+        self._spinbox_locale.setNumberOptions(QLocale.OmitGroupSeparator | QLocale.RejectGroupSeparator)
+        
+        # Widgets of lazily built tabs (None until their tab is built)
+        self.trajectory_type = None
+        self.metrics_display = None
+        
+        # Index into _TRAJ_TYPES of the selected trajectory type
+        self._cur_type_idx = 0
+        
+        # Last session's parameters; restored before the spinboxes are built
+        self._settings = QSettings("AiMissionPlanner", "TrajectoryGUI")
+        self.restore_settings()
+        
         self.init_ui()
+        self._status = self.statusBar()
         self.setWindowTitle("3D Trajectory Generator")
         self.setGeometry(100, 100, 1600, 900)
     
@@ -721,18 +1078,24 @@ class TrajectoryGeneratorGUI(QMainWindow):
         basic_tab = self.create_basic_params_tab()
         tabs.addTab(basic_tab, "Basic")
         
-        # Tab 2: Advanced Parameters
-        advanced_tab = self.create_advanced_params_tab()
-        tabs.addTab(advanced_tab, "Advanced")
-        
-        # Tab 3: Trajectory Type
-        trajectory_tab = self.create_trajectory_type_tab()
-        tabs.addTab(trajectory_tab, "Trajectory Type")
-        
-        # Tab 4: Metrics
-        metrics_tab = self.create_metrics_tab()
-        tabs.addTab(metrics_tab, "Metrics")
+        # Tabs 2-4 (Advanced, Trajectory Type, Metrics) start as empty
+        # placeholders and are built the first time they are shown or needed
+        self._tab_placeholders = {}
+        self._tab_builders = {}
+        for title, builder in (("Advanced", self.create_advanced_params_tab),
+                               ("Trajectory Type", self.create_trajectory_type_tab),
+                               ("Metrics", self.create_metrics_tab)):
+            placeholder = QWidget()
+            placeholder_layout = QVBoxLayout()
+            placeholder_layout.setContentsMargins(0, 0, 0, 0)
+            placeholder.setLayout(placeholder_layout)
+            
+            index = tabs.addTab(placeholder, title)
+            self._tab_placeholders[index] = placeholder
+            self._tab_builders[index] = builder
+        self._metrics_tab_index = index
         
+        tabs.currentChanged.connect(self._build_tab)
         layout.addWidget(tabs)
         
         # Buttons
@@ -761,197 +1124,88 @@ class TrajectoryGeneratorGUI(QMainWindow):
         panel.setLayout(layout)
         return panel
     
+    def _build_tab(self, index: int):
+        """Build a lazily created tab into its placeholder (no-op once built)"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            self._tab_placeholders.pop(index).layout().addWidget(builder())
+    
     def create_basic_params_tab(self) -> QWidget:
         """Create basic parameters tab"""
         widget = QWidget()
         layout = QVBoxLayout()
         
-        # Scroll area for parameters
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout()
-        
         # Start point group
         start_group = QGroupBox("Start Point")
-        start_layout = QGridLayout()
-        
-        start_layout.addWidget(QLabel("X (m):"), 0, 0)
-        self.start_x = QDoubleSpinBox()
-        self.start_x.setRange(-5000, 5000)
-        self.start_x.setValue(self.params.start_x)
-        self.start_x.setSingleStep(10)
-        start_layout.addWidget(self.start_x, 0, 1)
-        
-        start_layout.addWidget(QLabel("Y (m):"), 1, 0)
-        self.start_y = QDoubleSpinBox()
-        self.start_y.setRange(-5000, 5000)
-        self.start_y.setValue(self.params.start_y)
-        self.start_y.setSingleStep(10)
-        start_layout.addWidget(self.start_y, 1, 1)
-        
-        start_layout.addWidget(QLabel("Z (m):"), 2, 0)
-        self.start_z = QDoubleSpinBox()
-        self.start_z.setRange(0, 2000)
-        self.start_z.setValue(self.params.start_z)
-        self.start_z.setSingleStep(10)
-        start_layout.addWidget(self.start_z, 2, 1)
-        
-        start_group.setLayout(start_layout)
-        scroll_layout.addWidget(start_group)
+        start_group.setLayout(self._build_spinbox_form(self._START_ROWS))
+        layout.addWidget(start_group)
         
         # End point group
         end_group = QGroupBox("End Point")
-        end_layout = QGridLayout()
-        
-        end_layout.addWidget(QLabel("X (m):"), 0, 0)
-        self.end_x = QDoubleSpinBox()
-        self.end_x.setRange(-5000, 5000)
-        self.end_x.setValue(self.params.end_x)
-        self.end_x.setSingleStep(10)
-        end_layout.addWidget(self.end_x, 0, 1)
-        
-        end_layout.addWidget(QLabel("Y (m):"), 1, 0)
-        self.end_y = QDoubleSpinBox()
-        self.end_y.setRange(-5000, 5000)
-        self.end_y.setValue(self.params.end_y)
-        self.end_y.setSingleStep(10)
-        end_layout.addWidget(self.end_y, 1, 1)
-        
-        end_layout.addWidget(QLabel("Z (m):"), 2, 0)
-        self.end_z = QDoubleSpinBox()
-        self.end_z.setRange(0, 2000)
-        self.end_z.setValue(self.params.end_z)
-        self.end_z.setSingleStep(10)
-        end_layout.addWidget(self.end_z, 2, 1)
-        
-        end_group.setLayout(end_layout)
-        scroll_layout.addWidget(end_group)
+        end_group.setLayout(self._build_spinbox_form(self._END_ROWS))
+        layout.addWidget(end_group)
         
         # Constraints group
         constraints_group = QGroupBox("Physical Constraints")
-        constraints_layout = QGridLayout()
-        
-        constraints_layout.addWidget(QLabel("Max Altitude (m):"), 0, 0)
-        self.max_altitude = QDoubleSpinBox()
-        self.max_altitude.setRange(50, 5000)
-        self.max_altitude.setValue(self.params.max_altitude)
-        self.max_altitude.setSingleStep(50)
-        constraints_layout.addWidget(self.max_altitude, 0, 1)
-        
-        constraints_layout.addWidget(QLabel("Min Altitude (m):"), 1, 0)
-        self.min_altitude = QDoubleSpinBox()
-        self.min_altitude.setRange(0, 1000)
-        self.min_altitude.setValue(self.params.min_altitude)
-        self.min_altitude.setSingleStep(10)
-        constraints_layout.addWidget(self.min_altitude, 1, 1)
-        
-        constraints_layout.addWidget(QLabel("Max Speed (m/s):"), 2, 0)
-        self.max_speed = QDoubleSpinBox()
-        self.max_speed.setRange(10, 1000)
-        self.max_speed.setValue(self.params.max_speed)
-        self.max_speed.setSingleStep(10)
-        constraints_layout.addWidget(self.max_speed, 2, 1)
-        
-        constraints_layout.addWidget(QLabel("Max G-Turn:"), 3, 0)
-        self.max_g_turn = QDoubleSpinBox()
-        self.max_g_turn.setRange(1, 12)
-        self.max_g_turn.setValue(self.params.max_g_turn)
-        self.max_g_turn.setSingleStep(0.5)
-        constraints_layout.addWidget(self.max_g_turn, 3, 1)
-        
-        constraints_layout.addWidget(QLabel("Turn Radius (m):"), 4, 0)
-        self.turn_radius = QDoubleSpinBox()
-        self.turn_radius.setRange(10, 1000)
-        self.turn_radius.setValue(self.params.turn_radius)
-        self.turn_radius.setSingleStep(10)
-        constraints_layout.addWidget(self.turn_radius, 4, 1)
-        
-        constraints_layout.addWidget(QLabel("Number of Waypoints:"), 5, 0)
-        self.n_waypoints = QSpinBox()
-        self.n_waypoints.setRange(10, 500)
-        self.n_waypoints.setValue(self.params.n_waypoints)
-        self.n_waypoints.setSingleStep(10)
-        constraints_layout.addWidget(self.n_waypoints, 5, 1)
-        
-        constraints_group.setLayout(constraints_layout)
-        scroll_layout.addWidget(constraints_group)
-        
-        scroll_layout.addStretch()
-        scroll_widget.setLayout(scroll_layout)
-        scroll.setWidget(scroll_widget)
-        
-        layout.addWidget(scroll)
+        constraints_group.setLayout(self._build_spinbox_form(self._CONSTRAINT_ROWS))
+        layout.addWidget(constraints_group)
+        
+        layout.addStretch()
         widget.setLayout(layout)
-        return widget
+        return self._scroll_if_tall(widget)
+    
+    def _scroll_if_tall(self, widget: QWidget) -> QWidget:
+        """Wrap a tab's content in a vertical-only QScrollArea if it is too tall to fit"""
+        if widget.sizeHint().height() <= self._SCROLL_THRESHOLD:
+            return widget
+        
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        scroll.setWidget(widget)
+        return scroll
+    
+    def _build_spinbox_form(self, rows: Tuple) -> QFormLayout:
+        """Build a label/spinbox form from a row table, storing each spinbox as self.<parameter>"""
+        form = QFormLayout()
+        form.setRowWrapPolicy(QFormLayout.DontWrapRows)
+        form.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+        
+        for name, label, minimum, maximum, step, decimals in rows:
+            if decimals is None:
+                spinbox = QSpinBox()
+            else:
+                spinbox = QDoubleSpinBox()
+                spinbox.setDecimals(decimals)
+            spinbox.setRange(minimum, maximum)
+            spinbox.setValue(getattr(self.params, name))
+            spinbox.setSingleStep(step)
+            
+            # Emit valueChanged on Enter/focus-out rather than per keystroke,
+            # and speed up stepping while an arrow button is held
+            spinbox.setKeyboardTracking(False)
+            spinbox.setAccelerated(True)
+            spinbox.setLocale(self._spinbox_locale)
+            
+            setattr(self, name, spinbox)
+            self._spinboxes[name] = spinbox
+            form.addRow(label, spinbox)
+        
+        return form
     
     def create_advanced_params_tab(self) -> QWidget:
         """Create advanced parameters tab"""
         widget = QWidget()
         layout = QVBoxLayout()
         
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout()
-        
         # Advanced parameters group
         advanced_group = QGroupBox("Advanced Parameters")
-        advanced_layout = QGridLayout()
-        
-        advanced_layout.addWidget(QLabel("Smoothness (0-1):"), 0, 0)
-        self.smoothness = QDoubleSpinBox()
-        self.smoothness.setRange(0, 1)
-        self.smoothness.setValue(self.params.smoothness)
-        self.smoothness.setSingleStep(0.1)
-        advanced_layout.addWidget(self.smoothness, 0, 1)
-        
-        advanced_layout.addWidget(QLabel("Max Acceleration (m/s²):"), 1, 0)
-        self.max_acceleration = QDoubleSpinBox()
-        self.max_acceleration.setRange(1, 200)
-        self.max_acceleration.setValue(self.params.max_acceleration)
-        self.max_acceleration.setSingleStep(5)
-        advanced_layout.addWidget(self.max_acceleration, 1, 1)
-        
-        advanced_layout.addWidget(QLabel("Banking Angle (°):"), 2, 0)
-        self.banking_angle = QDoubleSpinBox()
-        self.banking_angle.setRange(0, 90)
-        self.banking_angle.setValue(self.params.banking_angle)
-        self.banking_angle.setSingleStep(5)
-        advanced_layout.addWidget(self.banking_angle, 2, 1)
-        
-        advanced_layout.addWidget(QLabel("Climb Rate (m/s):"), 3, 0)
-        self.climb_rate = QDoubleSpinBox()
-        self.climb_rate.setRange(1, 50)
-        self.climb_rate.setValue(self.params.climb_rate)
-        self.climb_rate.setSingleStep(1)
-        advanced_layout.addWidget(self.climb_rate, 3, 1)
-        
-        advanced_layout.addWidget(QLabel("Descent Rate (m/s):"), 4, 0)
-        self.descent_rate = QDoubleSpinBox()
-        self.descent_rate.setRange(1, 50)
-        self.descent_rate.setValue(self.params.descent_rate)
-        self.descent_rate.setSingleStep(1)
-        advanced_layout.addWidget(self.descent_rate, 4, 1)
-        
-        advanced_layout.addWidget(QLabel("Curvature Limit (rad/m):"), 5, 0)
-        self.curvature_limit = QDoubleSpinBox()
-        self.curvature_limit.setRange(0.001, 0.1)
-        self.curvature_limit.setValue(self.params.curvature_limit)
-        self.curvature_limit.setSingleStep(0.001)
-        self.curvature_limit.setDecimals(4)
-        advanced_layout.addWidget(self.curvature_limit, 5, 1)
-        
-        advanced_group.setLayout(advanced_layout)
-        scroll_layout.addWidget(advanced_group)
-        
-        scroll_layout.addStretch()
-        scroll_widget.setLayout(scroll_layout)
-        scroll.setWidget(scroll_widget)
-        
-        layout.addWidget(scroll)
+        advanced_group.setLayout(self._build_spinbox_form(self._ADVANCED_ROWS))
+        layout.addWidget(advanced_group)
+        
+        layout.addStretch()
         widget.setLayout(layout)
-        return widget
+        return self._scroll_if_tall(widget)
     
     def create_trajectory_type_tab(self) -> QWidget:
         """Create trajectory type selection tab"""
@@ -962,30 +1216,16 @@ class TrajectoryGeneratorGUI(QMainWindow):
         type_layout = QVBoxLayout()
         
         self.trajectory_type = QComboBox()
-        trajectory_types = [
-            "Bezier",
-            "Circular",
-            "Ascending Spiral",
-            "Descending Spiral",
-            "S-Curve",
-            "L-Curve",
-            "Zigzag",
-            "Helix",
-            "Figure Eight",
-            "Parabolic",
-            "Combat Maneuver",
-            "Terrain Following"
-        ]
-        self.trajectory_type.addItems(trajectory_types)
-        self.trajectory_type.setCurrentText("Bezier")
+        self.trajectory_type.addItems([display for display, _, _ in self._TRAJ_TYPES])
+        self.trajectory_type.setCurrentIndex(self._cur_type_idx)
         type_layout.addWidget(self.trajectory_type)
         
         # Description label
         self.type_description = QTextEdit()
         self.type_description.setReadOnly(True)
         self.type_description.setMaximumHeight(150)
-        self.update_trajectory_description()
-        self.trajectory_type.currentTextChanged.connect(self.update_trajectory_description)
+        self.update_trajectory_description(self._cur_type_idx)
+        self.trajectory_type.currentIndexChanged.connect(self.update_trajectory_description)
         type_layout.addWidget(QLabel("Description:"))
         type_layout.addWidget(self.type_description)
         
@@ -1004,7 +1244,8 @@ class TrajectoryGeneratorGUI(QMainWindow):
         metrics_group = QGroupBox("Trajectory Metrics")
         metrics_layout = QVBoxLayout()
         
-        self.metrics_display = QTextEdit()
+        # Plain-text widget: line-based layout, no rich-text document per update
+        self.metrics_display = QPlainTextEdit()
         self.metrics_display.setReadOnly(True)
         self.metrics_display.setPlainText("Generate a trajectory to see metrics...")
         
@@ -1015,104 +1256,98 @@ class TrajectoryGeneratorGUI(QMainWindow):
         widget.setLayout(layout)
         return widget
     
-    def update_trajectory_description(self):
+    def update_trajectory_description(self, index: int):
         """Update trajectory type description"""
-        descriptions = {
-            "Bezier": "Smooth curve using Bezier control points. Good for general-purpose smooth paths.",
-            "Circular": "Circular arc connecting start and end points. Maintains constant turn rate.",
-            "Ascending Spiral": "Spiral path gaining altitude. Useful for climb maneuvers with lateral displacement.",
-            "Descending Spiral": "Spiral path losing altitude. Useful for descent maneuvers with controlled rate.",
-            "S-Curve": "S-shaped lateral deviation while progressing to target. Good for evasive maneuvers.",
-            "L-Curve": "L-shaped path with sharp corner. Useful for waypoint navigation.",
-            "Zigzag": "Zigzag pattern with periodic lateral deviations. Useful for search patterns.",
-            "Helix": "Helical path around axis of motion. Combines forward progress with circular motion.",
-            "Figure Eight": "Figure-eight pattern in 3D space. Complex aerobatic maneuver.",
-            "Parabolic": "Parabolic arc with peak altitude. Ballistic-style trajectory.",
-            "Combat Maneuver": "Aggressive maneuver combining climb and roll. Immelmann turn-inspired.",
-            "Terrain Following": "Path following simulated terrain variations. Low-altitude flight profile."
-        }
-        
-        current_type = self.trajectory_type.currentText()
-        description = descriptions.get(current_type, "No description available.")
-        self.type_description.setPlainText(description)
+        self._cur_type_idx = index
+        self.type_description.setPlainText(self._TRAJ_TYPES[index][2])
     
     def update_parameters_from_ui(self):
         """Update parameters from UI controls"""
-        # Start point
-        self.params.start_x = self.start_x.value()
-        self.params.start_y = self.start_y.value()
-        self.params.start_z = self.start_z.value()
-        
-        # End point
-        self.params.end_x = self.end_x.value()
-        self.params.end_y = self.end_y.value()
-        self.params.end_z = self.end_z.value()
-        
-        # Constraints
-        self.params.max_altitude = self.max_altitude.value()
-        self.params.min_altitude = self.min_altitude.value()
-        self.params.max_speed = self.max_speed.value()
-        self.params.max_g_turn = self.max_g_turn.value()
-        self.params.turn_radius = self.turn_radius.value()
-        self.params.n_waypoints = self.n_waypoints.value()
-        
-        # Advanced
-        self.params.smoothness = self.smoothness.value()
-        self.params.max_acceleration = self.max_acceleration.value()
-        self.params.banking_angle = self.banking_angle.value()
-        self.params.climb_rate = self.climb_rate.value()
-        self.params.descent_rate = self.descent_rate.value()
-        self.params.curvature_limit = self.curvature_limit.value()
+        # Spinboxes of tabs that have not been built yet still hold params' values
+        for name, spinbox in self._spinboxes.items():
+            setattr(self.params, name, spinbox.value())
         
         # Trajectory type
-        self.params.trajectory_type = self.trajectory_type.currentText().replace(" ", "_").lower()
+        if self.trajectory_type is not None:
+            self.params.trajectory_type = self._TRAJ_TYPES[self._cur_type_idx][1]
     
+    @qdebounced(150)
     def generate_trajectory(self):
-        """Generate and visualize trajectory"""
+        """Generate trajectory in the background and visualize it when ready"""
         try:
             # Update parameters
             self.update_parameters_from_ui()
-            
-            # Generate trajectory
-            trajectory = self.generator.generate_trajectory(self.params)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to generate trajectory:\n{str(e)}")
+            return
+        
+        # Nothing to do if this exact trajectory is already shown or in flight
+        key = self.params.cache_key()
+        if key == self._last_key:
+            self._status.showMessage("Parameters unchanged - trajectory already generated", 3000)
+            return
+        self._last_key = key
+        
+        # Supersede any request that has not started yet
+        self.thread_pool.clear()
+        self._request_id += 1
+        
+        # Snapshot parameters so UI edits cannot race with the worker
+        worker = TrajectoryWorker(self._request_id, self.generator, copy.copy(self.params))
+        worker.signals.finished.connect(self._on_trajectory_ready)
+        worker.signals.failed.connect(self._on_trajectory_failed)
+        self.thread_pool.start(worker)
+    
+    def _on_trajectory_ready(self, request_id: int, trajectory: np.ndarray, metrics: Dict):
+        """Display a finished trajectory and its metrics on the GUI thread"""
+        if request_id != self._request_id:
+            return
+        
+        try:
             self.current_trajectory = trajectory
             
-            # Calculate metrics
-            metrics = self.generator.calculate_metrics(trajectory, self.params)
-            
             # Display metrics
             self.display_metrics(metrics)
             
-            # Visualize
-            self.visualizer.add_trajectory(trajectory)
+            # Visualize (deferred so bursts collapse into one redraw)
+            self._pending_trajectory = trajectory
+            self._redraw_timer.start()
             
-            QMessageBox.information(self, "Success", 
-                                   f"Generated trajectory with {len(trajectory)} waypoints!")
+            # Non-modal feedback: no dialog to dismiss after every Generate
+            self._status.showMessage(f"Generated {len(trajectory)} waypoints", 3000)
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to generate trajectory:\n{str(e)}")
     
+    def _flush_redraw(self):
+        """Add the most recent pending trajectory to the 3D view"""
+        trajectory, self._pending_trajectory = self._pending_trajectory, None
+        if trajectory is not None:
+            self.visualizer.add_trajectory(trajectory)
+    
+    def _on_trajectory_failed(self, request_id: int, message: str):
+        """Report a failed generation on the GUI thread"""
+        if request_id != self._request_id:
+            return
+        
+        self._last_key = None
+        QMessageBox.critical(self, "Error", f"Failed to generate trajectory:\n{message}")
+    
     def display_metrics(self, metrics: Dict):
         """Display trajectory metrics"""
-        text = "=== Trajectory Metrics ===\n\n"
-        text += f"Path Length: {metrics['path_length']:.2f} m\n"
-        text += f"Straight Line Distance: {metrics['straight_line_distance']:.2f} m\n"
-        text += f"Path Efficiency: {metrics['path_efficiency']:.2%}\n"
-        text += f"\nAverage Curvature: {metrics['avg_curvature']:.6f} rad/m\n"
-        text += f"Maximum Curvature: {metrics['max_curvature']:.6f} rad/m\n"
-        text += f"Estimated Max G-Force: {metrics['max_g_force']:.2f} g\n"
-        text += f"\nMinimum Altitude: {metrics['min_altitude']:.2f} m\n"
-        text += f"Maximum Altitude: {metrics['max_altitude']:.2f} m\n"
-        text += f"Altitude Range: {metrics['altitude_range']:.2f} m\n"
-        text += f"\nNumber of Waypoints: {metrics['n_waypoints']}\n"
-        
-        self.metrics_display.setPlainText(text)
+        self._build_tab(self._metrics_tab_index)
+        
+        self.metrics_display.setPlainText(self._METRICS_TMPL.format_map(metrics))
     
     def clear_all(self):
         """Clear all trajectories"""
+        self._redraw_timer.stop()
+        self._pending_trajectory = None
         self.visualizer.clear_trajectories()
         self.current_trajectory = None
-        self.metrics_display.setPlainText("Generate a trajectory to see metrics...")
+        self._last_key = None
+        if self.metrics_display is not None:
+            self.metrics_display.setPlainText("Generate a trajectory to see metrics...")
     
     def save_trajectory(self):
         """Save trajectory to file"""
@@ -1126,17 +1361,25 @@ class TrajectoryGeneratorGUI(QMainWindow):
         
         if filename:
             try:
+                # Waypoints are written as C-contiguous float32 (the GUI's display dtype)
+                trajectory = np.ascontiguousarray(self.current_trajectory, dtype=np.float32)
+                
                 if filename.endswith('.npy'):
-                    np.save(filename, self.current_trajectory)
+                    np.save(filename, trajectory, allow_pickle=False)
                 elif filename.endswith('.json'):
                     data = {
-                        'trajectory': self.current_trajectory.tolist(),
+                        'trajectory': trajectory,
                         'parameters': self.params.to_dict()
                     }
-                    with open(filename, 'w') as f:
-                        json.dump(data, f, indent=2)
+                    if ORJSON_AVAILABLE:
+                        with open(filename, 'wb') as f:
+                            f.write(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
+                    else:
+                        data['trajectory'] = data['trajectory'].tolist()
+                        with open(filename, 'w') as f:
+                            json.dump(data, f, indent=2)
                 else:
-                    np.save(filename + '.npy', self.current_trajectory)
+                    np.save(filename + '.npy', trajectory, allow_pickle=False)
                 
                 QMessageBox.information(self, "Success", f"Trajectory saved to {filename}")
             except Exception as e:
@@ -1165,29 +1408,33 @@ class TrajectoryGeneratorGUI(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to load parameters:\n{str(e)}")
     
+    def restore_settings(self):
+        """Restore spinbox parameters saved by the previous session"""
+        for rows in (self._START_ROWS, self._END_ROWS, self._CONSTRAINT_ROWS, self._ADVANCED_ROWS):
+            for name, *_ in rows:
+                default = getattr(self.params, name)
+                try:
+                    setattr(self.params, name, self._settings.value(name, default, type=type(default)))
+                except (TypeError, ValueError):
+                    pass
+    
+    def closeEvent(self, event):
+        """Save spinbox parameters for the next session"""
+        # Spinboxes of tabs never built still hold the restored params' values
+        for name, spinbox in self._spinboxes.items():
+            self._settings.setValue(name, spinbox.value())
+        super().closeEvent(event)
+    
     def update_ui_from_parameters(self):
         """Update UI controls from parameters"""
-        self.start_x.setValue(self.params.start_x)
-        self.start_y.setValue(self.params.start_y)
-        self.start_z.setValue(self.params.start_z)
-        
-        self.end_x.setValue(self.params.end_x)
-        self.end_y.setValue(self.params.end_y)
-        self.end_z.setValue(self.params.end_z)
-        
-        self.max_altitude.setValue(self.params.max_altitude)
-        self.min_altitude.setValue(self.params.min_altitude)
-        self.max_speed.setValue(self.params.max_speed)
-        self.max_g_turn.setValue(self.params.max_g_turn)
-        self.turn_radius.setValue(self.params.turn_radius)
-        self.n_waypoints.setValue(self.params.n_waypoints)
-        
-        self.smoothness.setValue(self.params.smoothness)
-        self.max_acceleration.setValue(self.params.max_acceleration)
-        self.banking_angle.setValue(self.params.banking_angle)
-        self.climb_rate.setValue(self.params.climb_rate)
-        self.descent_rate.setValue(self.params.descent_rate)
-        self.curvature_limit.setValue(self.params.curvature_limit)
+        # Block valueChanged while bulk-loading so listeners see one settled state
+        blockers = [QSignalBlocker(spinbox) for spinbox in self._spinboxes.values()]
+        try:
+            for name, spinbox in self._spinboxes.items():
+                spinbox.setValue(getattr(self.params, name))
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
 
 
 def main():
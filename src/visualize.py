@@ -10,14 +10,121 @@ warnings.filterwarnings('ignore', message='.*MINGW-W64.*')
 warnings.filterwarnings('ignore', category=RuntimeWarning, module='numpy')
 warnings.filterwarnings('ignore', message='.*invalid value encountered.*')
 
+import os
+import sys
+import hashlib
+import shutil
+
 import numpy as np
+import matplotlib
+
+# Headless Linux (no X11/Wayland display): use the Agg backend instead of
+# loading a GUI toolkit that could never open a window, and treat show=True
+# as show=False
+_HAS_DISPLAY = not sys.platform.startswith('linux') or bool(
+    os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+if not _HAS_DISPLAY:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
-from matplotlib.animation import FuncAnimation
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+from matplotlib.animation import FFMpegWriter, PillowWriter
+from matplotlib.lines import Line2D
+from PIL import Image
 import plotly.graph_objects as go
 import plotly.express as px
-from typing import List, Optional, Dict
-import os
+from typing import List, Optional, Dict, Union
+from dataclasses import dataclass
+
+
+@dataclass
+class Obstacles:
+    """Spherical obstacles as parallel arrays: centers [M, 3] and radii [M]"""
+    centers: np.ndarray
+    radii: np.ndarray
+
+
+def _to_soa(obstacles: Union[Obstacles, List[Dict], None]) -> Optional[Obstacles]:
+    """Normalize obstacles (Obstacles or a list of {center, radius} dicts) to Obstacles; None if empty"""
+    if obstacles is None:
+        return None
+    if isinstance(obstacles, Obstacles):
+        centers, radii = obstacles.centers, obstacles.radii
+    else:
+        centers = [obs['center'] for obs in obstacles]
+        radii = [obs['radius'] for obs in obstacles]
+    
+    radii = np.asarray(radii, dtype=np.float64).reshape(-1)
+    if radii.size == 0:
+        return None
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 3)
+    return Obstacles(centers, radii)
+
+
+def _prep(arr: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    """Convert points to C-contiguous float32 for the plotting backends (None passes through)"""
+    if arr is None:
+        return None
+    return np.ascontiguousarray(arr, dtype=np.float32)
+
+
+def _hash_update(digest, part):
+    """Feed arrays (by shape and raw bytes), containers and scalars into a hash"""
+    if isinstance(part, np.ndarray):
+        digest.update(repr((part.dtype.str, part.shape)).encode())
+        digest.update(np.ascontiguousarray(part).tobytes())
+    elif isinstance(part, Obstacles):
+        _hash_update(digest, (part.centers, part.radii))
+    elif isinstance(part, dict):
+        for key in sorted(part):
+            digest.update(repr(key).encode())
+            _hash_update(digest, part[key])
+    elif isinstance(part, (list, tuple)):
+        digest.update(b'[')
+        for item in part:
+            _hash_update(digest, item)
+        digest.update(b']')
+    else:
+        digest.update(repr(part).encode())
+
+
+# Salt for render cache keys; bump whenever a change to the plotting code
+# alters the pixels produced for the same inputs
+_RENDER_CACHE_VERSION = 1
+
+
+def _render_cache_digest(*parts):
+    """Hash of render inputs plus everything global that affects the pixels"""
+    digest = hashlib.blake2b(digest_size=16)
+    style = {key: value for key, value in matplotlib.rcParams.items() if key != 'backend'}
+    _hash_update(digest, (_RENDER_CACHE_VERSION, matplotlib.__version__, style) + parts)
+    return digest
+
+
+def _figure_size(ax) -> Optional[tuple]:
+    """Size in inches of the figure a caller-supplied axis lives in (None when a new figure is made)"""
+    if ax is None:
+        return None
+    return tuple(ax.figure.get_size_inches())
+
+
+def _lod_indices(seq_len: int, max_points: int) -> np.ndarray:
+    """Uniform-stride indices selecting about max_points of seq_len points, always including the last"""
+    stride = max(1, -(-seq_len // max_points))
+    indices = np.arange(0, seq_len, stride)
+    
+    # Keep the final waypoint so the decimated path still ends at the target
+    if indices[-1] != seq_len - 1:
+        indices = np.append(indices, seq_len - 1)
+    return indices
+
+
+def _decimate(points: np.ndarray, max_points: int) -> np.ndarray:
+    """Uniformly subsample points along the sequence axis (-2) to about max_points, keeping the last one"""
+    if points.shape[-2] <= max_points:
+        return points
+    return points[..., _lod_indices(points.shape[-2], max_points), :]
 
 
 class TrajectoryVisualizer:
@@ -26,13 +133,33 @@ class TrajectoryVisualizer:
     def __init__(self, figsize=(12, 8)):
         self.figsize = figsize
         
+        # Unit sphere mesh (20x20), scaled and shifted per obstacle
+        u = np.linspace(0, 2 * np.pi, 20)
+        v = np.linspace(0, np.pi, 20)
+        self._sx = np.outer(np.cos(u), np.sin(v))
+        self._sy = np.outer(np.sin(u), np.sin(v))
+        self._sz = np.outer(np.ones(np.size(u)), np.cos(v))
+        
+        # Triangle indices (two per grid cell) into the flattened unit sphere grid
+        rows, cols = self._sx.shape
+        corner = (np.arange(rows - 1)[:, None] * cols + np.arange(cols - 1)).ravel()
+        self._sphere_tris = np.concatenate([
+            np.stack([corner, corner + cols, corner + 1], axis=1),
+            np.stack([corner + 1, corner + cols, corner + cols + 1], axis=1),
+        ])
+        
     def plot_single_trajectory_3d(self, trajectory: np.ndarray, 
                                    start: Optional[np.ndarray] = None,
                                    end: Optional[np.ndarray] = None,
-                                   obstacles: Optional[List[Dict]] = None,
+                                   obstacles: Union[Obstacles, List[Dict], None] = None,
                                    title: str = "3D Trajectory",
                                    save_path: Optional[str] = None,
-                                   show: bool = True):
+                                   show: bool = True,
+                                   max_points: int = 2000,
+                                   save_dpi: int = 100,
+                                   tight: bool = False,
+                                   ax=None,
+                                   cache_dir: Optional[str] = None):
         """
         Plot a single trajectory in 3D
         
@@ -40,21 +167,36 @@ class TrajectoryVisualizer:
             trajectory: Waypoints [seq_len, 3]
             start: Start point [3]
             end: End point [3]
-            obstacles: List of obstacles [{center, radius}, ...]
+            obstacles: Obstacles, or list of obstacles [{center, radius}, ...]
             title: Plot title
             save_path: Path to save figure
             show: Whether to display the plot
+            max_points: Waypoint markers are decimated to about this many
+            save_dpi: Resolution of the saved figure
+            tight: Crop the saved figure to its contents (extra layout pass)
+            ax: Existing 3D axis to clear and draw into (its figure is left open)
+            cache_dir: Directory keeping saved figures for reuse on identical inputs
         """
-        fig = plt.figure(figsize=self.figsize)
-        ax = fig.add_subplot(111, projection='3d')
-        
-        # Plot trajectory
+        show = show and _HAS_DISPLAY
+        trajectory, start, end = _prep(trajectory), _prep(start), _prep(end)
+        obstacles = _to_soa(obstacles)
+        
+        # Batch runs: reuse the image rendered earlier for identical inputs
+        cache_path = None
+        if cache_dir and save_path and not show:
+            cache_path = self._plot_cache_path(cache_dir, save_path, 'single', trajectory, start, end, obstacles,
+                                               title, max_points, save_dpi, tight, _figure_size(ax))
+            if self._restore_cached_plot(cache_path, save_path):
+                return
+        
+        fig, ax, own_figure = self._figure_axes(ax)
+        
+        # Plot trajectory with its waypoints as line markers (one artist);
+        # level of detail: markers for long paths are subsampled
         ax.plot(trajectory[:, 0], trajectory[:, 1], trajectory[:, 2],
-               'b-', linewidth=2, label='Trajectory', alpha=0.8)
-        
-        # Plot waypoints
-        ax.scatter(trajectory[:, 0], trajectory[:, 1], trajectory[:, 2],
-                  c='blue', s=20, alpha=0.5)
+               'b-o', linewidth=2, label='Trajectory', alpha=0.8,
+               markersize=np.sqrt(20), markerfacecolor='blue', markeredgewidth=0,
+               markevery=_lod_indices(len(trajectory), max_points))
         
         # Plot start and end
         if start is not None:
@@ -72,9 +214,9 @@ class TrajectoryVisualizer:
                       edgecolors='black', linewidths=2, label='End', zorder=10)
         
         # Plot obstacles
-        if obstacles:
-            for obs in obstacles:
-                self._draw_sphere(ax, obs['center'], obs['radius'], alpha=0.3, color='red')
+        if obstacles is not None:
+            for x, y, z in zip(*self._sphere_meshes(obstacles)):
+                ax.plot_surface(x, y, z, color='red', alpha=0.3)
         
         ax.set_xlabel('X (m)', fontsize=12)
         ax.set_ylabel('Y (m)', fontsize=12)
@@ -84,13 +226,15 @@ class TrajectoryVisualizer:
         ax.grid(True, alpha=0.3)
         
         if save_path:
-            plt.savefig(save_path, dpi=150, bbox_inches='tight')
+            fig.savefig(save_path, dpi=save_dpi, bbox_inches='tight' if tight else None)
+            if cache_path:
+                self._store_cached_plot(save_path, cache_path)
             print(f"✓ Saved to {save_path}")
         
         if show:
             plt.show()
-        else:
-            plt.close()
+        elif own_figure:
+            plt.close(fig)
     
     def plot_multiple_trajectories(self, trajectories: np.ndarray,
                                    start: np.ndarray,
@@ -98,7 +242,12 @@ class TrajectoryVisualizer:
                                    ground_truth: Optional[np.ndarray] = None,
                                    title: str = "Multiple Trajectory Candidates",
                                    save_path: Optional[str] = None,
-                                   show: bool = True):
+                                   show: bool = True,
+                                   max_points: int = 2000,
+                                   save_dpi: int = 100,
+                                   tight: bool = False,
+                                   ax=None,
+                                   cache_dir: Optional[str] = None):
         """
         Plot multiple trajectory candidates
         
@@ -110,17 +259,51 @@ class TrajectoryVisualizer:
             title: Plot title
             save_path: Path to save
             show: Whether to display
+            max_points: Each trajectory is decimated to about this many points
+            save_dpi: Resolution of the saved figure
+            tight: Crop the saved figure to its contents (extra layout pass)
+            ax: Existing 3D axis to clear and draw into (its figure is left open)
+            cache_dir: Directory keeping saved figures for reuse on identical inputs
         """
-        fig = plt.figure(figsize=self.figsize)
-        ax = fig.add_subplot(111, projection='3d')
-        
-        # Plot generated trajectories
-        n_samples = len(trajectories)
-        colors = plt.cm.rainbow(np.linspace(0, 1, n_samples))
-        
-        for i, (traj, color) in enumerate(zip(trajectories, colors)):
-            ax.plot(traj[:, 0], traj[:, 1], traj[:, 2],
-                   color=color, linewidth=2, alpha=0.6, label=f'Gen {i+1}')
+        show = show and _HAS_DISPLAY
+        trajectories, start, end = _prep(trajectories), _prep(start), _prep(end)
+        ground_truth = _prep(ground_truth)
+        
+        # Batch runs: reuse the image rendered earlier for identical inputs
+        cache_path = None
+        if cache_dir and save_path and not show:
+            cache_path = self._plot_cache_path(cache_dir, save_path, 'multiple', trajectories, start, end, ground_truth,
+                                               title, max_points, save_dpi, tight, _figure_size(ax))
+            if self._restore_cached_plot(cache_path, save_path):
+                return
+        
+        # Level of detail: subsample long trajectories before 3D projection
+        trajectories = _decimate(trajectories, max_points)
+        if ground_truth is not None:
+            ground_truth = _decimate(ground_truth, max_points)
+        
+        fig, ax, own_figure = self._figure_axes(ax)
+        
+        # Plot generated trajectories as one segment collection, so the 3D
+        # projection is a single batched transform instead of one per line
+        n_samples, seq_len = trajectories.shape[:2]
+        levels = np.linspace(0, 1, n_samples, dtype=np.float32)
+        
+        # Colours come from mapping each segment's trajectory level through
+        # the rainbow colormap in one vectorized step at draw time
+        segments = np.stack([trajectories[:, :-1], trajectories[:, 1:]], axis=2).reshape(-1, 2, 3)
+        generated = Line3DCollection(segments, linewidths=2, alpha=0.6)
+        generated.set_array(np.repeat(levels, seq_len - 1))
+        generated.set_cmap('rainbow')
+        generated.set_clim(0, 1)
+        ax.add_collection3d(generated)
+        # Older matplotlib does not autoscale to collections; the scatter and
+        # ground truth plotted below extend these limits as usual
+        ax.auto_scale_xyz(*trajectories.reshape(-1, 3).T)
+        
+        # Legend entries stand in for the per-trajectory lines (never projected)
+        legend_handles = [Line2D([], [], color=generated.cmap(level), linewidth=2, alpha=0.6, label=f'Gen {i+1}')
+                          for i, level in enumerate(levels)]
         
         # Plot ground truth if provided
         if ground_truth is not None:
@@ -137,22 +320,27 @@ class TrajectoryVisualizer:
         ax.set_ylabel('Y (m)', fontsize=12)
         ax.set_zlabel('Z (m)', fontsize=12)
         ax.set_title(title, fontsize=14, fontweight='bold')
-        ax.legend(loc='upper left', fontsize=8)
+        handles, _ = ax.get_legend_handles_labels()
+        ax.legend(handles=legend_handles + handles, loc='upper left', fontsize=8)
         ax.grid(True, alpha=0.3)
         
         if save_path:
-            plt.savefig(save_path, dpi=150, bbox_inches='tight')
+            fig.savefig(save_path, dpi=save_dpi, bbox_inches='tight' if tight else None)
+            if cache_path:
+                self._store_cached_plot(save_path, cache_path)
             print(f"✓ Saved to {save_path}")
         
         if show:
             plt.show()
-        else:
-            plt.close()
+        elif own_figure:
+            plt.close(fig)
     
     def plot_trajectory_metrics(self, trajectories: np.ndarray,
                                metrics: List[Dict],
                                save_path: Optional[str] = None,
-                               show: bool = True):
+                               show: bool = True,
+                               save_dpi: int = 100,
+                               tight: bool = False):
         """
         Plot metrics comparison for multiple trajectories
         
@@ -161,30 +349,37 @@ class TrajectoryVisualizer:
             metrics: List of metric dictionaries
             save_path: Path to save
             show: Whether to display
+            save_dpi: Resolution of the saved figure
+            tight: Crop the saved figure to its contents (extra layout pass)
         """
+        show = show and _HAS_DISPLAY
+        
         fig, axes = plt.subplots(2, 3, figsize=(15, 10))
         fig.suptitle('Trajectory Metrics Comparison', fontsize=16, fontweight='bold')
         
         metric_keys = ['path_length', 'path_efficiency', 'avg_curvature', 
                       'smoothness_score', 'avg_altitude', 'avg_velocity']
         
-        for idx, (ax, key) in enumerate(zip(axes.flat, metric_keys)):
-            values = [m[key] for m in metrics]
-            
-            ax.bar(range(len(values)), values, color='steelblue', alpha=0.7)
+        # Extract each metric across trajectories once into its own array
+        n_metrics = len(metrics)
+        values = {key: np.fromiter((m[key] for m in metrics), dtype=np.float32, count=n_metrics)
+                  for key in metric_keys}
+        trajectory_ids = np.arange(n_metrics)
+        
+        for ax, key in zip(axes.flat, metric_keys):
+            bars = ax.bar(trajectory_ids, values[key], color='steelblue', alpha=0.7)
             ax.set_xlabel('Trajectory ID', fontsize=10)
             ax.set_ylabel(key.replace('_', ' ').title(), fontsize=10)
             ax.set_title(key.replace('_', ' ').title(), fontsize=12, fontweight='bold')
             ax.grid(True, alpha=0.3, axis='y')
             
             # Add value labels
-            for i, v in enumerate(values):
-                ax.text(i, v, f'{v:.2f}', ha='center', va='bottom', fontsize=8)
+            ax.bar_label(bars, fmt='%.2f', fontsize=8)
         
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=150, bbox_inches='tight')
+            plt.savefig(save_path, dpi=save_dpi, bbox_inches='tight' if tight else None)
             print(f"✓ Saved to {save_path}")
         
         if show:
@@ -195,8 +390,9 @@ class TrajectoryVisualizer:
     def plot_interactive_3d(self, trajectories: np.ndarray,
                            start: np.ndarray,
                            end: np.ndarray,
-                           obstacles: Optional[List[Dict]] = None,
-                           save_path: Optional[str] = None):
+                           obstacles: Union[Obstacles, List[Dict], None] = None,
+                           save_path: Optional[str] = None,
+                           include_plotlyjs='cdn'):
         """
         Create interactive 3D plot using Plotly
         
@@ -204,31 +400,44 @@ class TrajectoryVisualizer:
             trajectories: Multiple trajectories [n_samples, seq_len, 3]
             start: Start point [3]
             end: End point [3]
-            obstacles: List of obstacles
+            obstacles: Obstacles, or list of obstacles [{center, radius}, ...]
             save_path: Path to save HTML file
+            include_plotlyjs: How the saved HTML gets plotly.js ('cdn', True to embed, 'directory')
         """
+        trajectories, start, end = _prep(trajectories), _prep(start), _prep(end)
+        obstacles = _to_soa(obstacles)
+        
         fig = go.Figure()
         
         # Add trajectories
-        n_samples = len(trajectories) if trajectories.ndim == 3 else 1
-        
         if trajectories.ndim == 2:
             trajectories = trajectories[np.newaxis, ...]
         
+        n_samples, seq_len = trajectories.shape[:2]
         colors = px.colors.qualitative.Plotly
         
-        for i, traj in enumerate(trajectories):
+        # All trajectories go into one WebGL trace: NaN rows break the line
+        # between trajectories and a stepped colorscale colours each by index
+        gaps = np.full((n_samples, 1, 3), np.nan, dtype=trajectories.dtype)
+        points = np.concatenate([trajectories, gaps], axis=1).reshape(-1, 3)
+        traj_ids = np.repeat(np.arange(n_samples), seq_len + 1)
+        colorscale = []
+        for i in range(n_samples):
             color = colors[i % len(colors)]
-            
-            fig.add_trace(go.Scatter3d(
-                x=traj[:, 0],
-                y=traj[:, 1],
-                z=traj[:, 2],
-                mode='lines+markers',
-                name=f'Trajectory {i+1}',
-                line=dict(color=color, width=4),
-                marker=dict(size=2)
-            ))
+            colorscale += [[i / n_samples, color], [(i + 1) / n_samples, color]]
+        color_range = dict(color=traj_ids, colorscale=colorscale, cmin=-0.5, cmax=n_samples - 0.5)
+        
+        fig.add_trace(go.Scatter3d(
+            x=points[:, 0],
+            y=points[:, 1],
+            z=points[:, 2],
+            mode='lines+markers',
+            name=f'Trajectories ({n_samples})',
+            line=dict(width=4, **color_range),
+            marker=dict(size=2, **color_range),
+            customdata=traj_ids + 1,
+            hovertemplate='Trajectory %{customdata}<br>x=%{x}<br>y=%{y}<br>z=%{z}<extra></extra>'
+        ))
         
         # Add start point
         fig.add_trace(go.Scatter3d(
@@ -250,23 +459,25 @@ class TrajectoryVisualizer:
             marker=dict(size=15, color='red', symbol='square')
         ))
         
-        # Add obstacles
-        if obstacles:
-            for i, obs in enumerate(obstacles):
-                # Create sphere mesh
-                u = np.linspace(0, 2 * np.pi, 20)
-                v = np.linspace(0, np.pi, 20)
-                x = obs['radius'] * np.outer(np.cos(u), np.sin(v)) + obs['center'][0]
-                y = obs['radius'] * np.outer(np.sin(u), np.sin(v)) + obs['center'][1]
-                z = obs['radius'] * np.outer(np.ones(np.size(u)), np.cos(v)) + obs['center'][2]
-                
-                fig.add_trace(go.Surface(
-                    x=x, y=y, z=z,
-                    showscale=False,
-                    opacity=0.3,
-                    colorscale=[[0, 'red'], [1, 'red']],
-                    name=f'Obstacle {i+1}'
-                ))
+        # Add obstacles: all spheres merged into one mesh trace (one draw call)
+        if obstacles is not None:
+            n_obstacles = len(obstacles.radii)
+            vertices = np.stack(self._sphere_meshes(obstacles), axis=-1).reshape(-1, 3).astype(np.float32)
+            offsets = np.arange(n_obstacles)[:, np.newaxis, np.newaxis] * self._sx.size
+            triangles = (self._sphere_tris + offsets).reshape(-1, 3).astype(np.int32)
+            
+            fig.add_trace(go.Mesh3d(
+                x=vertices[:, 0],
+                y=vertices[:, 1],
+                z=vertices[:, 2],
+                i=triangles[:, 0],
+                j=triangles[:, 1],
+                k=triangles[:, 2],
+                color='red',
+                opacity=0.3,
+                name=f'Obstacles ({n_obstacles})',
+                showlegend=True
+            ))
         
         fig.update_layout(
             title='3D Trajectory Visualization',
@@ -281,7 +492,7 @@ class TrajectoryVisualizer:
         )
         
         if save_path:
-            fig.write_html(save_path)
+            fig.write_html(save_path, include_plotlyjs=include_plotlyjs, full_html=True, validate=False)
             print(f"✓ Interactive plot saved to {save_path}")
         else:
             fig.show()
@@ -290,7 +501,8 @@ class TrajectoryVisualizer:
                         start: np.ndarray,
                         end: np.ndarray,
                         save_path: str,
-                        fps: int = 10):
+                        fps: int = 10,
+                        frame_cache_dir: Optional[str] = None):
         """
         Create animated visualization of trajectory
         
@@ -300,24 +512,47 @@ class TrajectoryVisualizer:
             end: End point
             save_path: Path to save animation (GIF or MP4)
             fps: Frames per second
+            frame_cache_dir: Directory keeping rendered GIF frames for reuse on identical inputs
         """
+        trajectory, start, end = _prep(trajectory), _prep(start), _prep(end)
+        
+        if save_path.endswith('.mp4'):
+            output_path = save_path
+        else:
+            output_path = save_path if save_path.endswith('.gif') else save_path + '.gif'
+        
+        # GIF frame cache: raw RGBA frames stored as one .npy per input hash
+        frames_path = None
+        if frame_cache_dir and output_path.endswith('.gif'):
+            digest = _render_cache_digest(self.figsize, trajectory, start, end)
+            frames_path = os.path.join(frame_cache_dir, digest.hexdigest() + '.npy')
+            if os.path.exists(frames_path):
+                self._write_gif(np.load(frames_path, mmap_mode='r'), output_path, fps)
+                print(f"✓ Animation saved to {save_path} (cached frames)")
+                return
+        
         fig = plt.figure(figsize=self.figsize)
         ax = fig.add_subplot(111, projection='3d')
         
         # Set up plot limits
-        all_points = np.vstack([trajectory, start[np.newaxis, :], end[np.newaxis, :]])
-        margin = 0.1 * (all_points.max(axis=0) - all_points.min(axis=0))
+        lo = np.minimum(trajectory.min(axis=0), np.minimum(start, end))
+        hi = np.maximum(trajectory.max(axis=0), np.maximum(start, end))
+        margin = 0.1 * (hi - lo)
         
-        ax.set_xlim(all_points[:, 0].min() - margin[0], all_points[:, 0].max() + margin[0])
-        ax.set_ylim(all_points[:, 1].min() - margin[1], all_points[:, 1].max() + margin[1])
-        ax.set_zlim(all_points[:, 2].min() - margin[2], all_points[:, 2].max() + margin[2])
+        ax.set_xlim(lo[0] - margin[0], hi[0] + margin[0])
+        ax.set_ylim(lo[1] - margin[1], hi[1] + margin[1])
+        ax.set_zlim(lo[2] - margin[2], hi[2] + margin[2])
         
         # Plot start and end
         ax.scatter(*start, c='green', s=200, marker='o', label='Start')
         ax.scatter(*end, c='red', s=200, marker='s', label='End')
         
-        # Initialize line
-        line, = ax.plot([], [], [], 'b-', linewidth=2, label='Trajectory')
+        # Initialize path: all segments are built once, frames only reveal a prefix
+        # (added with the full set so no matplotlib version sees an empty collection)
+        segments = np.stack([trajectory[:-1], trajectory[1:]], axis=1)
+        path = Line3DCollection(segments, colors='b', linewidths=2, label='Trajectory')
+        ax.add_collection3d(path)
+        path.set_segments(segments[:0])
         point, = ax.plot([], [], [], 'bo', markersize=10)
         
         ax.set_xlabel('X (m)')
@@ -329,40 +564,92 @@ class TrajectoryVisualizer:
         
         def update(frame):
             # Update trajectory up to current frame
-            line.set_data(trajectory[:frame, 0], trajectory[:frame, 1])
-            line.set_3d_properties(trajectory[:frame, 2])
+            path.set_segments(segments[:max(frame - 1, 0)])
             
             # Update current position
             if frame > 0:
                 point.set_data([trajectory[frame-1, 0]], [trajectory[frame-1, 1]])
                 point.set_3d_properties([trajectory[frame-1, 2]])
-            
-            return line, point
-        
-        anim = FuncAnimation(fig, update, frames=len(trajectory)+1, 
-                           interval=1000/fps, blit=True)
         
-        # Save animation
-        if save_path.endswith('.gif'):
-            anim.save(save_path, writer='pillow', fps=fps)
-        elif save_path.endswith('.mp4'):
-            anim.save(save_path, writer='ffmpeg', fps=fps)
+        n_frames = len(trajectory) + 1
+        
+        if frames_path:
+            # Render into a memory-mapped frame store, then encode the GIF from it
+            fig.set_dpi(100)
+            os.makedirs(frame_cache_dir, exist_ok=True)
+            partial_path = frames_path + '.partial.npy'
+            frames = None
+            for frame in range(n_frames):
+                update(frame)
+                fig.canvas.draw()
+                rgba = np.asarray(fig.canvas.buffer_rgba())
+                if frames is None:
+                    frames = np.lib.format.open_memmap(partial_path, mode='w+', dtype=np.uint8,
+                                                       shape=(n_frames,) + rgba.shape)
+                frames[frame] = rgba
+            frames.flush()
+            del frames
+            os.replace(partial_path, frames_path)
+            
+            self._write_gif(np.load(frames_path, mmap_mode='r'), output_path, fps)
         else:
-            anim.save(save_path + '.gif', writer='pillow', fps=fps)
+            # Stream frames straight into the writer (no in-memory frame list)
+            if output_path.endswith('.mp4'):
+                writer = FFMpegWriter(fps=fps, codec='h264')
+            else:
+                writer = PillowWriter(fps=fps)
+            
+            with writer.saving(fig, output_path, dpi=100):
+                for frame in range(n_frames):
+                    update(frame)
+                    writer.grab_frame()
         
         print(f"✓ Animation saved to {save_path}")
         plt.close()
     
-    def _draw_sphere(self, ax, center, radius, alpha=0.3, color='red'):
-        """Draw a sphere (obstacle) on 3D axis"""
-        u = np.linspace(0, 2 * np.pi, 20)
-        v = np.linspace(0, np.pi, 20)
-        
-        x = radius * np.outer(np.cos(u), np.sin(v)) + center[0]
-        y = radius * np.outer(np.sin(u), np.sin(v)) + center[1]
-        z = radius * np.outer(np.ones(np.size(u)), np.cos(v)) + center[2]
+    def _write_gif(self, frames: np.ndarray, output_path: str, fps: int):
+        """Encode RGBA frames [n, height, width, 4] as a looping GIF (same settings as PillowWriter)"""
+        images = [Image.fromarray(np.asarray(frame), 'RGBA') for frame in frames]
+        images[0].save(output_path, save_all=True, append_images=images[1:],
+                       duration=int(1000 / fps), loop=0)
+    
+    def _figure_axes(self, ax=None):
+        """(figure, 3D axis, created) - a new figure, or the caller's axis cleared for reuse"""
+        if ax is None:
+            fig = plt.figure(figsize=self.figsize)
+            return fig, fig.add_subplot(111, projection='3d'), True
+        
+        ax.clear()
+        return ax.figure, ax, False
+    
+    def _plot_cache_path(self, cache_dir: str, save_path: str, *parts) -> str:
+        """Cache file for a figure, keyed by a hash of everything that determines its pixels"""
+        digest = _render_cache_digest(self.figsize, *parts)
         
-        ax.plot_surface(x, y, z, color=color, alpha=alpha)
+        extension = os.path.splitext(save_path)[1] or '.png'
+        return os.path.join(cache_dir, digest.hexdigest() + extension)
+    
+    def _restore_cached_plot(self, cache_path: str, save_path: str) -> bool:
+        """Copy a previously rendered figure to save_path; False if it is not cached"""
+        if not os.path.exists(cache_path):
+            return False
+        
+        shutil.copyfile(cache_path, save_path)
+        print(f"✓ Saved to {save_path} (cached)")
+        return True
+    
+    def _store_cached_plot(self, save_path: str, cache_path: str):
+        """Keep a copy of a freshly rendered figure for later identical calls"""
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        shutil.copyfile(save_path, cache_path)
+    
+    def _sphere_meshes(self, obstacles: Obstacles):
+        """Surface grids (x, y, z), each [M, 20, 20], for all obstacles from the cached unit sphere"""
+        radii = obstacles.radii[:, np.newaxis, np.newaxis]
+        centers = obstacles.centers[:, :, np.newaxis, np.newaxis]
+        return (radii * self._sx + centers[:, 0],
+                radii * self._sy + centers[:, 1],
+                radii * self._sz + centers[:, 2])
 
 
 def demo_visualization():
@@ -376,24 +663,17 @@ def demo_visualization():
     start = np.array([0.0, 0.0, 100.0])
     end = np.array([800.0, 600.0, 200.0])
     
-    # Generate dummy trajectory
+    # Generate multiple trajectories: phase offsets broadcast over (sample, time)
     t = np.linspace(0, 1, 50)
-    trajectory = np.column_stack([
-        start[0] + (end[0] - start[0]) * t + 100 * np.sin(2*np.pi*t*2),
-        start[1] + (end[1] - start[1]) * t + 100 * np.cos(2*np.pi*t*2),
-        start[2] + (end[2] - start[2]) * t + 50 * np.sin(2*np.pi*t)
-    ])
+    i = np.arange(5)[:, np.newaxis]
+    trajectories = np.stack([
+        start[0] + (end[0] - start[0]) * t + 100 * np.sin(2*np.pi*t*2 + i),
+        start[1] + (end[1] - start[1]) * t + 100 * np.cos(2*np.pi*t*2 + i),
+        start[2] + (end[2] - start[2]) * t + 50 * np.sin(2*np.pi*t + i*0.5)
+    ], axis=-1)
     
-    # Generate multiple trajectories
-    trajectories = []
-    for i in range(5):
-        traj = np.column_stack([
-            start[0] + (end[0] - start[0]) * t + 100 * np.sin(2*np.pi*t*2 + i),
-            start[1] + (end[1] - start[1]) * t + 100 * np.cos(2*np.pi*t*2 + i),
-            start[2] + (end[2] - start[2]) * t + 50 * np.sin(2*np.pi*t + i*0.5)
-        ])
-        trajectories.append(traj)
-    trajectories = np.array(trajectories)
+    # The single-trajectory demo uses the zero-phase candidate
+    trajectory = trajectories[0]
     
     # Create obstacles
     obstacles = [
@@ -407,13 +687,18 @@ def demo_visualization():
     # Create output directory
     os.makedirs('visualizations', exist_ok=True)
     
+    # One figure shared by the matplotlib demos (each plot clears the axis)
+    fig = plt.figure(figsize=viz.figsize)
+    ax = fig.add_subplot(111, projection='3d')
+    
     # 1. Single trajectory
     print("\n1. Plotting single trajectory...")
     viz.plot_single_trajectory_3d(
         trajectory, start, end, obstacles,
         title="Single Trajectory with Obstacles",
         save_path='visualizations/single_trajectory.png',
-        show=False
+        show=False,
+        ax=ax
     )
     
     # 2. Multiple trajectories
@@ -422,8 +707,10 @@ def demo_visualization():
         trajectories, start, end,
         title="Multiple Trajectory Candidates",
         save_path='visualizations/multiple_trajectories.png',
-        show=False
+        show=False,
+        ax=ax
     )
+    plt.close(fig)
     
     # 3. Interactive plot
     print("3. Creating interactive 3D plot...")
@@ -5,7 +5,54 @@ Tests all dependencies and provides a clear pass/fail report
 """
 
 import sys
+import json
 import subprocess
+import importlib
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import version, PackageNotFoundError
+
+# GUI imports that can take down the interpreter (broken Qt plugins or
+# OpenGL drivers) are only ever tried in a child process, which builds the
+# one QApplication they all share
+ISOLATED_MODULES = (
+    "PyQt5.QtCore", "PyQt5.QtWidgets", "PyQt5.QtGui",
+    "pyqtgraph",
+    "OpenGL",
+    "pyqtgraph.opengl",
+)
+
+# (results key, display name, module(s), distribution, locate only) per
+# probe, in report order; rows with a None key start a new section
+PROBES = (
+    (None, "Core Dependencies", None, None, False),
+    ('numpy', "NumPy", "numpy", "numpy", False),
+    ('scipy', "SciPy", ("scipy", "scipy.interpolate"), "scipy", False),
+    ('torch', "PyTorch", "torch", "torch", False),
+    (None, "GUI Dependencies", None, None, False),
+    ('pyqt5', "PyQt5", ("PyQt5.QtCore", "PyQt5.QtWidgets", "PyQt5.QtGui"), "PyQt5", False),
+    ('pyqtgraph', "PyQtGraph", "pyqtgraph", "pyqtgraph", False),
+    ('pyopengl', "PyOpenGL", "OpenGL", "PyOpenGL", False),
+    ('pyqtgraph_gl', "PyQtGraph OpenGL", "pyqtgraph.opengl", None, False),
+    (None, "Visualization Dependencies", None, None, False),
+    # The GUI never imports matplotlib, so only confirm it is installed
+    ('matplotlib', "Matplotlib", "matplotlib", "matplotlib", True),
+)
+
+_ISOLATED_PROBE = """
+import importlib, json, os, sys
+if sys.platform.startswith("linux") and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+app = None
+for name in sys.argv[1:]:
+    try:
+        module = importlib.import_module(name)
+        if name == "PyQt5.QtWidgets" and app is None:
+            app = module.QApplication.instance() or module.QApplication([])
+        print(json.dumps({"name": name}), flush=True)
+    except Exception as e:
+        print(json.dumps({"name": name, "error": repr(e)[:200]}), flush=True)
+"""
 
 def print_header(text):
     """Print a formatted header"""
@@ -13,49 +60,113 @@ def print_header(text):
     print(text.center(70))
     print("=" * 70 + "\n")
 
-def test_import(name, import_statement, version_statement=None):
-    """Test if a package can be imported"""
-    print(f"Testing {name}...", end=" ")
-    sys.stdout.flush()
-    
+def _run_probe(modules):
+    """Run _ISOLATED_PROBE over modules; returns ({module: JSON record}, crash message)"""
     try:
-        # Test in subprocess to catch fatal errors
         result = subprocess.run(
-            [sys.executable, '-c', import_statement],
+            [sys.executable, '-c', _ISOLATED_PROBE, *modules],
             capture_output=True,
             text=True,
-            timeout=10
+            timeout=30
         )
-        
-        if result.returncode != 0:
-            print("✗ FAILED")
-            if result.stderr:
-                print(f"  Error: {result.stderr.strip()[:200]}")
+    except subprocess.TimeoutExpired:
+        return {}, "TIMEOUT"
+    
+    records = {}
+    for line in result.stdout.splitlines():
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        records[record.pop("name")] = record
+    
+    crash = (result.stderr.strip()[-200:] or f"crashed (exit code {result.returncode})")
+    return records, crash
+
+def probe_isolated():
+    """Import ISOLATED_MODULES in one subprocess; returns {module: JSON record}"""
+    records, crash = _run_probe(ISOLATED_MODULES)
+    
+    # Modules never reported were not reached because the child crashed;
+    # retry them one per child so the crash is pinned on the right one
+    missing = [name for name in ISOLATED_MODULES if name not in records]
+    if len(missing) > 1:
+        for name in missing:
+            single, single_crash = _run_probe((name,))
+            records[name] = single.get(name, {"error": single_crash})
+    for name in missing:
+        records.setdefault(name, {"error": crash})
+    return records
+
+def probe_version(dist_name):
+    """Installed version of a distribution, read from its metadata without importing it"""
+    try:
+        return version(dist_name)
+    except PackageNotFoundError:
+        return None
+
+def test_import(name, modules, isolated, installed=None, locate_only=False):
+    """Test if a package can be imported
+    
+    Runs on the main thread: concurrent first imports of C-extension
+    packages can deadlock or see half-initialised modules. Only the isolated
+    child and the version lookups run in the background, handed in as
+    futures.
+    
+    Args:
+        name: Display name
+        modules: Module name, or tuple of module names, to import
+        isolated: Future of probe_isolated()
+        installed: Future of the distribution's installed version
+        locate_only: Only check that the modules are installed (find_spec),
+            without running their import-time code
+    
+    Returns:
+        True if the package passed
+    """
+    print(f"Testing {name}...", end=" ")
+    
+    if isinstance(modules, str):
+        modules = (modules,)
+    
+    # Crash-prone imports are answered by the isolated child
+    records = isolated.result() if any(m in ISOLATED_MODULES for m in modules) else {}
+    for module_name in modules:
+        error = records.get(module_name, {}).get("error")
+        if error:
+            print(f"✗ FAILED\n  Error: {error}")
             return False
+    
+    try:
+        for module_name in modules:
+            if module_name in records:
+                continue
+            if locate_only:
+                if importlib.util.find_spec(module_name) is None:
+                    raise ImportError(f"No module named '{module_name}'")
+            else:
+                importlib.import_module(module_name)
         
         # Get version if requested
-        version = "OK"
-        if version_statement:
-            result = subprocess.run(
-                [sys.executable, '-c', version_statement],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                version = result.stdout.strip()
+        version_text = installed.result() if installed else None
         
-        print(f"✓ PASSED ({version})")
+        print(f"✓ PASSED ({version_text or 'OK'})")
         return True
         
-    except subprocess.TimeoutExpired:
-        print("✗ TIMEOUT")
+    except ImportError as e:
+        print(f"✗ FAILED\n  Error: {str(e)[:200]}")
         return False
     except Exception as e:
         print(f"✗ ERROR: {e}")
         return False
 
 def main():
+    # Show each report line as soon as its probe finishes, even when piped
+    try:
+        sys.stdout.reconfigure(line_buffering=True)
+    except AttributeError:
+        pass
+    
     print_header("Installation Verification")
     
     print("This script tests all required dependencies for the GUI.\n")
@@ -75,65 +186,32 @@ def main():
         print("  ⚠ Python version may have compatibility issues")
         results['python'] = False
     
-    print("\n" + "-" * 70 + "\n")
-    
-    # Test core dependencies
-    print("Testing Core Dependencies:\n")
-    
-    results['numpy'] = test_import(
-        "NumPy",
-        "import numpy",
-        "import numpy; print(numpy.__version__)"
-    )
-    
-    results['scipy'] = test_import(
-        "SciPy",
-        "from scipy.interpolate import CubicSpline",
-        "import scipy; print(scipy.__version__)"
-    )
-    
-    results['torch'] = test_import(
-        "PyTorch",
-        "import torch",
-        "import torch; print(torch.__version__)"
-    )
+    # Dependency wheels won't match an unsupported interpreter; stop before
+    # importing anything heavy unless explicitly asked to carry on
+    if not results['python'] and '--force' not in sys.argv:
+        print("\n  ✗ Unsupported Python version - skipping dependency checks.")
+        print("    Install Python 3.9-3.12, or rerun with --force to check anyway.")
+        return 1
     
-    # Test GUI dependencies
     print("\n" + "-" * 70 + "\n")
-    print("Testing GUI Dependencies:\n")
-    
-    results['pyqt5'] = test_import(
-        "PyQt5",
-        "from PyQt5 import QtWidgets, QtCore, QtGui",
-        "from PyQt5 import QtCore; print(QtCore.QT_VERSION_STR)"
-    )
-    
-    results['pyqtgraph'] = test_import(
-        "PyQtGraph",
-        "import pyqtgraph",
-        "import pyqtgraph; print(pyqtgraph.__version__)"
-    )
-    
-    results['pyopengl'] = test_import(
-        "PyOpenGL",
-        "import OpenGL",
-        "import OpenGL; print(OpenGL.__version__)"
-    )
-    
-    results['pyqtgraph_gl'] = test_import(
-        "PyQtGraph OpenGL",
-        "import pyqtgraph.opengl as gl"
-    )
-    
-    # Test visualization dependencies
-    print("\n" + "-" * 70 + "\n")
-    print("Testing Visualization Dependencies:\n")
     
-    results['matplotlib'] = test_import(
-        "Matplotlib",
-        "import matplotlib",
-        "import matplotlib; print(matplotlib.__version__)"
-    )
+    # Only the isolated child and the metadata lookups run in the
+    # background; in-process imports stay sequential on this thread
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        isolated = executor.submit(probe_isolated)
+        installed = {
+            dist_name: executor.submit(probe_version, dist_name)
+            for _, _, _, dist_name, _ in PROBES
+            if dist_name is not None
+        }
+        
+        for key, name, modules, dist_name, locate_only in PROBES:
+            if key is None:
+                if results.keys() - {'python'}:
+                    print("\n" + "-" * 70 + "\n")
+                print(f"Testing {name}:\n")
+            else:
+                results[key] = test_import(name, modules, isolated, installed.get(dist_name), locate_only)
     
     # Summary
     print("\n" + "=" * 70 + "\n")
@@ -4,12 +4,12 @@ Quick verification script for NumPy/SciPy compatibility
 """
 
 import sys
+from importlib.metadata import version
 
-def check_version_constraint(version, min_ver, max_ver):
-    """Check if version satisfies min <= version < max"""
-    from packaging import version as ver
-    v = ver.parse(version)
-    return ver.parse(min_ver) <= v < ver.parse(max_ver)
+def _vtup(s):
+    """Release segment of a version string as an integer 3-tuple ("2.2.6" -> (2, 2, 6))"""
+    parts = tuple(int(p) for p in s.split('+', 1)[0].split('.')[:3] if p.isdigit())
+    return parts + (0,) * (3 - len(parts))
 
 def main():
     print("=" * 60)
@@ -29,22 +29,18 @@ def main():
     # Check NumPy
     try:
         import numpy as np
-        numpy_version = np.__version__
+        numpy_version = version("numpy")
         print(f"NumPy version: {numpy_version}")
         
         # Check if version is compatible
-        try:
-            from packaging import version as ver
-            v = ver.parse(numpy_version)
-            if ver.parse("2.0.0") <= v < ver.parse("2.3"):
-                print("✓ NumPy version is compatible (2.0.0 <= version < 2.3)")
-            elif v >= ver.parse("2.3"):
-                print("✗ NumPy version is too new (>=2.3), scipy 1.14.1 requires <2.3")
-                print("  Run: pip install 'numpy>=2.0.0,<2.3' --force-reinstall")
-            else:
-                print("⚠️  NumPy version is older than 2.0.0")
-        except ImportError:
-            print("  (packaging not available, skipping detailed version check)")
+        v = _vtup(numpy_version)
+        if (2, 0, 0) <= v < (2, 3, 0):
+            print("✓ NumPy version is compatible (2.0.0 <= version < 2.3)")
+        elif v >= (2, 3, 0):
+            print("✗ NumPy version is too new (>=2.3), scipy 1.14.1 requires <2.3")
+            print("  Run: pip install 'numpy>=2.0.0,<2.3' --force-reinstall")
+        else:
+            print("⚠️  NumPy version is older than 2.0.0")
             
     except ImportError as e:
         print(f"✗ NumPy not installed: {e}")
@@ -55,7 +51,7 @@ def main():
     # Check SciPy
     try:
         import scipy
-        scipy_version = scipy.__version__
+        scipy_version = version("scipy")
         print(f"SciPy version: {scipy_version}")
         print("✓ SciPy imported successfully")
     except ImportError as e:
@@ -72,15 +68,41 @@ def main():
         mean = np.mean(arr)
         print(f"  NumPy test: mean of [1,2,3,4,5] = {mean}")
         
-        # Test scipy functionality
-        from scipy import stats
-        result = stats.norm.cdf(0)
-        print(f"  SciPy test: norm.cdf(0) = {result}")
+        # Test scipy functionality (scipy.linalg exercises the BLAS linkage
+        # without pulling in the much larger scipy.stats import graph)
+        from scipy.linalg import norm
+        result = norm(np.array([3.0, 4.0]))
+        assert abs(result - 5.0) < 1e-9, f"unexpected norm {result}"
+        print(f"  SciPy test: linalg.norm([3,4]) = {result}")
         
         print("✓ All tests passed!")
     except Exception as e:
         print(f"✗ Error during testing: {e}")
         return 1
+    print()
+    
+    # Check optional Numba JIT (the GUI metrics kernel uses it when installed,
+    # and a Numba built against another NumPy ABI only fails at compile time)
+    try:
+        from numba import njit
+    except ImportError:
+        print("Numba not installed (optional)")
+    else:
+        try:
+            @njit
+            def _sum(a):
+                s = 0.0
+                for x in a:
+                    s += x
+                return s
+            
+            result = _sum(np.arange(8, dtype=np.float64))
+            assert result == 28.0, f"unexpected sum {result}"
+            print(f"✓ Numba {version('numba')} JIT compiled and ran")
+        except Exception as e:
+            print(f"✗ Numba JIT broken: {e}")
+            print("  Run: pip install --upgrade numba  (or uninstall it to use the NumPy fallback)")
+            return 1
     
     print()
     print("=" * 60)